@@ -181,7 +181,7 @@ with tab2:
                         
                         # Obtém estatísticas atualizadas
                         client = SupabaseClient()
-                        jobs = client.get_all_jobs()
+                        jobs = client.get_all_jobs(columns=['category', 'hierarchy'])
                         
                         if jobs:
                             # Inicializa contadores
@@ -328,8 +328,10 @@ with tab3:
     job_processor = JobProcessor()
     client = SupabaseClient()
     
-    # Obtém todas as vagas processadas
-    processed_jobs = client.get_processed_jobs()
+    # Obtém todas as vagas processadas (a descrição não é usada nas mensagens)
+    processed_jobs = client.get_processed_jobs(
+        columns=['url', 'title', 'company', 'location', 'salary', 'category', 'hierarchy', 'collected_at', 'posted_date']
+    )
     
     if not processed_jobs:
         st.warning("Nenhuma vaga processada encontrada. Por favor, processe algumas vagas primeiro.")
@@ -0,0 +1,208 @@
+from src.benchmark.fixture_server import FixtureServer
+from src.scraper.job_list_scraper import JobListScraper
+from src.scraper.job_scraper import JobScraper
+from src.scraper.browser_pool import BrowserPool
+from src.scraper.async_detail_scraper import AsyncDetailScraper
+from src.scraper.navigation import NavigationPolicy, WAIT_UNTIL_CHOICES, percentile
+from src.scraper.memory_governor import MemoryGovernor, psutil
+from src.utils.rate_limiter import configure_rate_limiter
+from src.utils.config import BENCHMARKS_DIR
+from datetime import datetime
+from typing import Dict, List
+import argparse
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Indisponível no Windows
+    resource = None
+
+def setup_logging(verbose: bool):
+    logging.basicConfig(
+        level=logging.INFO if verbose else logging.WARNING,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+class RssSampler:
+    """
+    Mede periodicamente o RSS dos navegadores durante uma etapa do benchmark.
+    Sem psutil, usa o maior RSS entre os processos filhos já encerrados
+    (getrusage), que só fica disponível depois que o navegador é fechado.
+    """
+
+    def __init__(self, interval: float = 0.2):
+        self.interval = interval
+        self.memory = MemoryGovernor(max_rss_mb=None, max_dom_nodes=None)
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        if psutil is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, self.memory.browser_rss(fresh=True) or 0)
+
+    def result(self) -> Dict:
+        if psutil is not None:
+            return {'peak_rss_mb': round(self.peak / 1024 / 1024, 1), 'rss_source': 'psutil'}
+        if resource is not None:
+            # ru_maxrss vem em KB no Linux
+            peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+            return {'peak_rss_mb': round(peak / 1024, 1), 'rss_source': 'getrusage'}
+        return {'peak_rss_mb': None, 'rss_source': None}
+
+def latency_summary(values: List[float]) -> Dict:
+    values = sorted(values)
+    return {
+        'p50_s': round(percentile(values, 50), 4),
+        'p95_s': round(percentile(values, 95), 4)
+    }
+
+def run_listing(server: FixtureServer, args) -> Dict:
+    """
+    Coleta a listagem sintética inteira e mede vagas/s e a latência por scroll
+    """
+    scraper = JobListScraper(
+        server.listing_url,
+        scroll_timeout_ms=int(args.scroll_timeout * 1000),
+        feed_url_pattern=r'/listagem/feed',
+        navigation=NavigationPolicy(wait_until=args.wait_until),
+        site_url=server.url
+    )
+    with RssSampler() as sampler:
+        started = time.monotonic()
+        if args.mode == 'feed':
+            jobs = scraper.fetch_jobs_from_feed(server.target_date)
+        else:
+            jobs = scraper.fetch_jobs_until_date(server.target_date)
+        elapsed = time.monotonic() - started
+
+    return {
+        'mode': args.mode,
+        'jobs': len(jobs),
+        'expected_jobs': server.cards,
+        'elapsed_s': round(elapsed, 3),
+        'jobs_per_s': round(len(jobs) / elapsed, 2) if elapsed else None,
+        'scroll_latency': latency_summary(scraper.scroll_latencies),
+        **sampler.result()
+    }
+
+def run_details(server: FixtureServer, args) -> Dict:
+    """
+    Coleta as páginas de detalhe e mede vagas/s e a latência por página
+    """
+    urls = server.detail_urls()[:args.details]
+    navigation = NavigationPolicy(wait_until=args.wait_until, early_stop=args.early_stop)
+    results = {'ok': 0, 'errors': 0}
+
+    def on_result(url, job, error):
+        results['ok' if job else 'errors'] += 1
+
+    with RssSampler() as sampler:
+        started = time.monotonic()
+        if args.concurrency > 1:
+            AsyncDetailScraper(concurrency=args.concurrency, pages_per_context=args.pages_per_context,
+                               navigation=navigation).scrape(urls, on_result)
+        else:
+            with BrowserPool(pages_per_context=args.pages_per_context) as pool:
+                for url in urls:
+                    try:
+                        with pool.page() as page:
+                            on_result(url, JobScraper(url, navigation=navigation).scrape(page), None)
+                    except Exception as e:
+                        on_result(url, None, e)
+        elapsed = time.monotonic() - started
+
+    ready_times = [t['ready'] for t in navigation.timings if t['ready'] is not None]
+    return {
+        'concurrency': args.concurrency,
+        'wait_until': args.wait_until,
+        'early_stop': args.early_stop,
+        'jobs': results['ok'],
+        'errors': results['errors'],
+        'elapsed_s': round(elapsed, 3),
+        'jobs_per_s': round(results['ok'] / elapsed, 2) if elapsed else None,
+        'page_latency': latency_summary(ready_times),
+        **sampler.result()
+    }
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description='Mede a vazão dos scrapers contra um servidor local com páginas sintéticas')
+    parser.add_argument('--cards', type=int, default=500, help='Número de vagas da listagem sintética')
+    parser.add_argument('--page-size', type=int, default=20, help='Cards por página do scroll infinito')
+    parser.add_argument('--details', type=int, default=200, help='Número de páginas de detalhe coletadas')
+    parser.add_argument('--latency', type=float, default=0,
+                        help='Atraso em segundos de cada resposta do servidor')
+    parser.add_argument('--analytics-delay', type=float, default=0,
+                        help='Inclui nas páginas uma requisição que fica pendente por N segundos')
+    parser.add_argument('--mode', choices=['dom', 'feed'], default='dom', help='Modo de coleta da listagem')
+    parser.add_argument('--concurrency', type=int, default=4, help='Páginas de detalhe em paralelo')
+    parser.add_argument('--pages-per-context', type=int, default=50,
+                        help='Páginas de detalhe por contexto do navegador')
+    parser.add_argument('--wait-until', choices=WAIT_UNTIL_CHOICES, default='domcontentloaded',
+                        help='Evento da navegação aguardado')
+    parser.add_argument('--early-stop', action='store_true',
+                        help='Interrompe o carregamento das páginas de detalhe após os seletores')
+    parser.add_argument('--scroll-timeout', type=float, default=5,
+                        help='Tempo máximo em segundos de espera por novos cards após cada scroll')
+    parser.add_argument('--skip-listing', action='store_true', help='Não executa a etapa da listagem')
+    parser.add_argument('--skip-details', action='store_true', help='Não executa a etapa de detalhes')
+    parser.add_argument('--output', default=None,
+                        help='Arquivo JSON do resultado (padrão: data/benchmarks/benchmark_<data>.json)')
+    parser.add_argument('--verbose', action='store_true', help='Mostra os logs dos scrapers')
+    args = parser.parse_args()
+    setup_logging(args.verbose)
+
+    # O servidor é local: o limitador de taxa não deve influenciar a medição
+    configure_rate_limiter(rate=1000, max_rate=1000, burst=args.concurrency)
+
+    report = {
+        'revision': git_revision(),
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'params': vars(args)
+    }
+    with FixtureServer(cards=args.cards, page_size=args.page_size, latency=args.latency,
+                       analytics_delay=args.analytics_delay) as server:
+        if not args.skip_listing:
+            report['listing'] = run_listing(server, args)
+            print(f"Listagem: {report['listing']['jobs']}/{server.cards} vagas, "
+                  f"{report['listing']['jobs_per_s']} vagas/s")
+        if not args.skip_details:
+            report['details'] = run_details(server, args)
+            print(f"Detalhes: {report['details']['jobs']} vagas, {report['details']['jobs_per_s']} vagas/s, "
+                  f"p50 {report['details']['page_latency']['p50_s']}s, "
+                  f"p95 {report['details']['page_latency']['p95_s']}s")
+        report['server_requests'] = server.requests
+
+    output = args.output
+    if output is None:
+        os.makedirs(BENCHMARKS_DIR, exist_ok=True)
+        output = os.path.join(BENCHMARKS_DIR, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"Resultado salvo em {output}")
+
+if __name__ == "__main__":
+    main()
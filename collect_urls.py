@@ -1,7 +1,15 @@
 from src.scraper.job_list_scraper import JobListScraper
 from src.data.url_processor import URLProcessor
+from src.scraper.resource_policy import ResourcePolicy
+from src.scraper.navigation import NavigationPolicy, WAIT_UNTIL_CHOICES
+from src.scraper.memory_governor import MemoryGovernor
+from src.utils.config import MAX_BROWSER_RSS_MB, MAX_DOM_NODES
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Set
 import argparse
 import logging
+import threading
+import time
 from datetime import datetime
 
 def setup_logging():
@@ -11,31 +19,190 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
+def read_base_urls(args) -> List[str]:
+    """
+    Junta as URLs passadas na linha de comando e as do arquivo, sem repetições
+    """
+    base_urls = list(args.base_urls)
+    if args.urls_file:
+        with open(args.urls_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    base_urls.append(line)
+    return list(dict.fromkeys(base_urls))
+
+def collect_city(base_url: str, target_date, args, processor: URLProcessor, db_lock: threading.Lock,
+                 known_urls: Optional[Set[str]] = None,
+                 on_saved: Optional[Callable[[List[Dict]], None]] = None) -> Dict:
+    """
+    Executa a coleta de uma cidade em seu próprio navegador e contexto.
+    As vagas encontradas são salvas durante a coleta, em checkpoints;
+    on_saved recebe cada lote logo depois de salvo.
+    """
+    resource_policy = None
+    if args.load_all_resources or args.no_asset_cache:
+        resource_policy = ResourcePolicy(
+            allow=['stylesheet'],
+            enabled=not args.load_all_resources,
+            use_asset_cache=not args.no_asset_cache
+        )
+    scraper = JobListScraper(
+        base_url,
+        resource_policy=resource_policy,
+        scroll_timeout_ms=int(args.scroll_timeout * 1000),
+        feed_url_pattern=args.feed_pattern,
+        profile=args.profile,
+        persistent_profile=args.persistent_profile,
+        navigation=NavigationPolicy(wait_until=args.wait_until),
+        memory=MemoryGovernor(max_rss_mb=args.max_browser_memory, max_dom_nodes=args.max_dom_nodes)
+    )
+
+    def save_checkpoint(jobs, state):
+        # A conexão com o banco é compartilhada pelas cidades
+        with db_lock:
+            processor.save_checkpoint(base_url, jobs, state)
+        if on_saved is not None and jobs:
+            on_saved(jobs)
+
+    resume_cursor = 0
+    if args.resume:
+        with db_lock:
+            checkpoint = processor.get_checkpoint(base_url)
+        if checkpoint:
+            resume_cursor = checkpoint['card_cursor']
+            logging.info(f"Retomando {base_url} a partir do card {resume_cursor} "
+                         f"(publicação {checkpoint['last_posted_date']}, checkpoint de {checkpoint['updated_at']})")
+
+    started = time.monotonic()
+    known_streak = args.known_streak if known_urls is not None else None
+    fetch = scraper.fetch_jobs_from_feed if args.mode == 'feed' else scraper.fetch_jobs_until_date
+    jobs_data = fetch(
+        target_date,
+        known_urls=known_urls,
+        known_streak=known_streak,
+        on_checkpoint=save_checkpoint,
+        checkpoint_every=args.checkpoint_every,
+        checkpoint_interval=args.checkpoint_interval,
+        resume_cursor=resume_cursor
+    )
+    return {
+        'base_url': base_url,
+        'jobs': jobs_data,
+        'elapsed': time.monotonic() - started
+    }
+
+def add_collect_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Argumentos da coleta da listagem (compartilhados com pipeline.py)
+    """
+    parser.add_argument('base_urls', nargs='*', help='URLs base para coleta de vagas (uma por cidade)')
+    parser.add_argument('--urls-file', help='Arquivo com uma URL base por linha')
+    parser.add_argument('--max-parallel', type=int, default=2,
+                        help='Número máximo de cidades coletadas ao mesmo tempo')
+    parser.add_argument('--target-date', help='Data limite para coleta (YYYY-MM-DD)', required=True)
+    parser.add_argument('--incremental', action='store_true',
+                        help='Para a coleta ao encontrar uma sequência de vagas já armazenadas')
+    parser.add_argument('--known-streak', type=int, default=20,
+                        help='Vagas seguidas já armazenadas que encerram a coleta incremental')
+    parser.add_argument('--mode', choices=['dom', 'feed'], default='dom',
+                        help='dom: lê os cards da página; feed: lê as respostas das requisições do scroll infinito')
+    parser.add_argument('--feed-pattern', default=None,
+                        help='Regex das URLs do feed de cards (modo feed); sem ela, vale a primeira resposta XHR/fetch com cards')
+    parser.add_argument('--scroll-timeout', type=float, default=10,
+                        help='Tempo máximo em segundos de espera por novos cards após cada scroll')
+    parser.add_argument('--load-all-resources', action='store_true',
+                        help='Não bloqueia imagens, fontes, mídia e rastreadores')
+    parser.add_argument('--profile', default=None,
+                        help='Nome do perfil do navegador cujos cookies/armazenamento são mantidos entre execuções')
+    parser.add_argument('--persistent-profile', action='store_true',
+                        help='Mantém o diretório de dados completo do perfil (use com uma cidade por vez)')
+    parser.add_argument('--no-asset-cache', action='store_true',
+                        help='Não usa o cache em disco de arquivos estáticos')
+    parser.add_argument('--wait-until', choices=WAIT_UNTIL_CHOICES, default='domcontentloaded',
+                        help='Evento da navegação aguardado antes de esperar os primeiros cards')
+    parser.add_argument('--max-browser-memory', type=float, default=MAX_BROWSER_RSS_MB,
+                        help='Memória (MB) dos navegadores a partir da qual a listagem é recarregada (requer psutil)')
+    parser.add_argument('--max-dom-nodes', type=int, default=MAX_DOM_NODES,
+                        help='Nós do DOM a partir dos quais os cards já lidos são removidos da página')
+    parser.add_argument('--checkpoint-every', type=int, default=100,
+                        help='Salva as vagas encontradas a cada N vagas novas')
+    parser.add_argument('--checkpoint-interval', type=float, default=60,
+                        help='Salva as vagas encontradas a cada N segundos')
+    parser.add_argument('--resume', action='store_true',
+                        help='Retoma coletas interrompidas a partir do último checkpoint')
+
+def validate_collect_arguments(parser: argparse.ArgumentParser, args, logger) -> List[str]:
+    """
+    Valida os argumentos da coleta e retorna as URLs base
+    """
+    base_urls = read_base_urls(args)
+    if not base_urls:
+        parser.error("Informe ao menos uma URL base ou --urls-file")
+    if args.persistent_profile and not args.profile:
+        parser.error("--persistent-profile exige --profile")
+    if args.persistent_profile and len(base_urls) > 1 and args.max_parallel > 1:
+        # O Chromium não permite dois navegadores usando o mesmo diretório de dados
+        logger.warning("Perfil persistente em uso: coletando uma cidade por vez")
+        args.max_parallel = 1
+    return base_urls
+
+def collect_all(base_urls: List[str], target_date, args, processor: URLProcessor, logger,
+                on_saved: Optional[Callable[[List[Dict]], None]] = None) -> List[Dict]:
+    """
+    Coleta as cidades em paralelo, cada uma com seu próprio navegador,
+    e retorna o resultado de cada uma
+    """
+    # No modo incremental, carrega as URLs já armazenadas no período
+    known_urls = processor.get_known_urls(since=target_date) if args.incremental else None
+
+    results = []
+    db_lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=max(1, args.max_parallel)) as executor:
+        futures = {
+            executor.submit(collect_city, url, target_date, args, processor, db_lock, known_urls, on_saved): url
+            for url in base_urls
+        }
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.error(f"Erro na coleta de {futures[future]}: {str(e)}")
+                results.append({'base_url': futures[future], 'jobs': [], 'elapsed': 0})
+
+    logger.info("\nResumo por cidade:")
+    for result in sorted(results, key=lambda r: base_urls.index(r['base_url'])):
+        logger.info(f"- {result['base_url']}: {len(result['jobs'])} vagas em {result['elapsed']:.1f}s")
+    return results
+
 def main():
     logger = setup_logging()
     
     # Configurar argumentos da linha de comando
     parser = argparse.ArgumentParser(description='Coletar URLs de vagas de emprego')
-    parser.add_argument('base_url', help='URL base para coleta de vagas')
-    parser.add_argument('--target-date', help='Data limite para coleta (YYYY-MM-DD)', required=True)
+    add_collect_arguments(parser)
     args = parser.parse_args()
+    base_urls = validate_collect_arguments(parser, args, logger)
 
     # Converter a data alvo para objeto datetime
     target_date = datetime.strptime(args.target_date, "%Y-%m-%d").date()
     
-    # Inicializar scraper e processor
-    scraper = JobListScraper(args.base_url)
+    logger.info(f"Coletando vagas de {len(base_urls)} cidade(s) até a data {target_date.strftime('%d/%m/%Y')}")
+    
     processor = URLProcessor()
+    results = collect_all(base_urls, target_date, args, processor, logger)
 
-    logger.info(f"Coletando vagas até a data {target_date.strftime('%d/%m/%Y')}")
-    
-    # Coleta vagas até atingir a data alvo
-    jobs_data = scraper.fetch_jobs_until_date(target_date)
+    # Junta os resultados sem URLs repetidas
+    jobs_by_url = {}
+    for result in results:
+        for job in result['jobs']:
+            jobs_by_url.setdefault(job['url'], job)
+    jobs_data = list(jobs_by_url.values())
     
     if jobs_data:
-        # Salvar dados
-        processor.save_urls(jobs_data)
-        
+        # As vagas já foram salvas nos checkpoints de cada cidade
+        logger.info(f"Total de vagas novas coletadas: {len(jobs_data)}")
+
         # Mostrar status
         status = processor.get_processing_status()
         logger.info("\nStatus da coleta:")
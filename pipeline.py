@@ -0,0 +1,235 @@
+from collect_urls import add_collect_arguments, validate_collect_arguments, collect_all
+from src.scraper.async_detail_scraper import AsyncDetailScraper
+from src.scraper.resource_policy import ResourcePolicy
+from src.scraper.navigation import NavigationPolicy, percentile
+from src.scraper.memory_governor import MemoryGovernor
+from src.data.job_processor import JobProcessor
+from src.data.url_processor import URLProcessor, LeaseRenewer
+from src.utils.rate_limiter import configure_rate_limiter
+from src.utils.retry import RetryPolicy, classify_error
+from src.utils.config import (RATE_LIMIT_DELAY, RATE_LIMIT_MAX_RATE, MAX_RETRIES, MAX_URL_ATTEMPTS,
+                              LEASE_SECONDS)
+from datetime import datetime
+from typing import Dict, List
+import argparse
+import logging
+import os
+import queue
+import socket
+import threading
+import time
+
+def setup_logging():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    return logging.getLogger(__name__)
+
+class DetailStage:
+    """
+    Etapa de detalhes do pipeline: uma thread com o AsyncDetailScraper
+    consumindo a fila limitada preenchida pela coleta da listagem (ou pelos
+    lotes reservados no process_jobs.py). Quando a fila enche, put()
+    bloqueia quem produz as URLs, o que segura o scroll até os workers de
+    detalhe alcançarem.
+
+    Os resultados e as tentativas iniciadas são gravados por uma terceira
+    thread: os callbacks chamados no loop de eventos só enfileiram, e
+    nenhuma página em andamento espera pelo banco.
+    """
+
+    def __init__(self, engine: AsyncDetailScraper, queue_size: int, save_batch: int = 10,
+                 max_attempts: int = MAX_URL_ATTEMPTS):
+        self.engine = engine
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.save_batch = save_batch
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.url_processor = URLProcessor(max_attempts=max_attempts)
+        self.job_processor = JobProcessor()
+        self.results = queue.Queue()
+        self.enqueued_at: Dict[str, float] = {}
+        self.latencies: List[float] = []
+        self.saved = 0
+        self.failed = 0
+        self.blocked_time = 0.0
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name='detalhes', daemon=True)
+        self._writer = threading.Thread(target=self._write_results, name='gravacao', daemon=True)
+
+    def start(self):
+        self._writer.start()
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.engine.scrape_stream(self.queue, self._save_result, on_start=self._start_url)
+        except Exception as e:
+            self.error = e
+            self.logger.error(f"Erro na etapa de detalhes: {str(e)}")
+
+    def put(self, url: str) -> bool:
+        """
+        Coloca uma URL na fila, esperando enquanto ela estiver cheia.
+        Retorna False se a etapa de detalhes parou.
+        """
+        self.enqueued_at[url] = time.monotonic()
+        started = time.monotonic()
+        while self._thread.is_alive():
+            try:
+                self.queue.put(url, timeout=1)
+                self.blocked_time += time.monotonic() - started
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def finish(self):
+        """
+        Sinaliza o fim da coleta, espera os workers esvaziarem a fila e a
+        gravação dos últimos resultados
+        """
+        if self._thread.is_alive():
+            self.queue.put(None)
+        self._thread.join()
+        self.results.put(None)
+        self._writer.join()
+
+    def _start_url(self, url):
+        # Chamados dentro do loop de eventos: só repassam para a thread de gravação
+        self.results.put(('start', url, None, None))
+
+    def _save_result(self, url, job, error):
+        self.results.put(('result', url, job, error))
+
+    def _write_results(self):
+        """
+        Conta as tentativas iniciadas, grava as vagas em lotes de
+        `save_batch` e registra as falhas. Um lote incompleto é gravado
+        quando a fila de resultados fica parada.
+        """
+        scraped = []
+        while True:
+            try:
+                item = self.results.get(timeout=1)
+            except queue.Empty:
+                self._flush(scraped)
+                continue
+            if item is None:
+                self._flush(scraped)
+                return
+            kind, url, job, error = item
+            if kind == 'start':
+                self.url_processor.start_attempt(url)
+            elif job:
+                scraped.append(job)
+                if len(scraped) >= self.save_batch:
+                    self._flush(scraped)
+            elif error is not None:
+                self.url_processor.record_failure(url, str(error), classify_error(error) == 'permanent')
+                self.failed += 1
+            else:
+                self.logger.warning(f"Nenhum dado encontrado para a vaga: {url}")
+
+    def _flush(self, scraped: List[Dict]):
+        """
+        Grava as vagas acumuladas em um lote, marcando as URLs como processadas
+        """
+        if not scraped:
+            return
+        saved = self.job_processor.save_jobs(scraped)
+        self.saved += saved
+        if saved:
+            now = time.monotonic()
+            for job in scraped:
+                self.latencies.append(now - self.enqueued_at.pop(job['url'], now))
+        scraped.clear()
+
+def main():
+    logger = setup_logging()
+
+    parser = argparse.ArgumentParser(description='Coleta a listagem e processa as vagas encontradas na mesma execução')
+    add_collect_arguments(parser)
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help='Número de páginas de detalhe processadas em paralelo')
+    parser.add_argument('--queue-size', type=int, default=50,
+                        help='URLs aguardando a etapa de detalhes antes de a coleta da listagem pausar')
+    parser.add_argument('--save-batch', type=int, default=10,
+                        help='Vagas coletadas gravadas juntas no banco')
+    parser.add_argument('--pages-per-context', type=int, default=50,
+                        help='Número de vagas processadas antes de reciclar o contexto do navegador')
+    parser.add_argument('--delay', type=float, default=RATE_LIMIT_DELAY,
+                        help='Intervalo inicial entre requisições ao mesmo host em segundos (ajustado automaticamente)')
+    parser.add_argument('--max-rate', type=float, default=RATE_LIMIT_MAX_RATE,
+                        help='Máximo de requisições por segundo por host')
+    parser.add_argument('--max-retries', type=int, default=MAX_RETRIES,
+                        help='Novas tentativas por vaga em caso de erro transitório')
+    parser.add_argument('--max-attempts', type=int, default=MAX_URL_ATTEMPTS,
+                        help='Ignora URLs cuja coleta já foi iniciada esse número de vezes sem sucesso')
+    parser.add_argument('--http', action='store_true',
+                        help='Extrai as vagas via HTTP e usa o navegador apenas como fallback')
+    parser.add_argument('--early-stop', action='store_true',
+                        help='Interrompe o carregamento da página assim que os seletores da vaga aparecem')
+    parser.add_argument('--worker-id', default=f"{socket.gethostname()}-{os.getpid()}",
+                        help='Identificador deste worker nas reservas de URLs')
+    parser.add_argument('--lease-seconds', type=int, default=LEASE_SECONDS,
+                        help='Validade da reserva das URLs enviadas para a etapa de detalhes')
+    # Checkpoints frequentes: cada lote salvo é enviado para a etapa de detalhes
+    parser.set_defaults(checkpoint_every=10, checkpoint_interval=5)
+    args = parser.parse_args()
+    base_urls = validate_collect_arguments(parser, args, logger)
+    target_date = datetime.strptime(args.target_date, "%Y-%m-%d").date()
+
+    # Listagem e detalhes acessam o mesmo host e dividem o limitador de taxa
+    configure_rate_limiter(rate=1 / args.delay if args.delay > 0 else args.max_rate, max_rate=args.max_rate)
+
+    engine = AsyncDetailScraper(
+        concurrency=args.concurrency,
+        pages_per_context=args.pages_per_context,
+        resource_policy=ResourcePolicy(enabled=not args.load_all_resources, use_asset_cache=not args.no_asset_cache),
+        http_first=args.http,
+        retry_policy=RetryPolicy(max_retries=args.max_retries),
+        profile=args.profile,
+        navigation=NavigationPolicy(wait_until=args.wait_until, early_stop=args.early_stop),
+        memory=MemoryGovernor(max_rss_mb=args.max_browser_memory)
+    )
+    details = DetailStage(engine, args.queue_size, args.save_batch, args.max_attempts).start()
+    queue_processor = URLProcessor()
+    queue_lock = threading.Lock()
+
+    def enqueue(jobs):
+        # Só seguem para os detalhes as URLs ainda pendentes e livres: vagas
+        # já processadas ou reservadas por outro worker são ignoradas
+        with queue_lock:
+            claimed = queue_processor.claim_urls(args.worker_id, len(jobs), args.lease_seconds,
+                                                 args.max_attempts, urls=[job['url'] for job in jobs])
+        for url in claimed:
+            if not details.put(url):
+                logger.error("Etapa de detalhes encerrada; as URLs restantes ficam para o process_jobs.py")
+                return
+
+    logger.info(f"Pipeline: coletando {len(base_urls)} cidade(s) até {target_date.strftime('%d/%m/%Y')} "
+                f"com {args.concurrency} páginas de detalhe em paralelo")
+    started = time.monotonic()
+    try:
+        # As reservas são renovadas enquanto houver URLs na fila ou em coleta
+        with LeaseRenewer(queue_processor, args.worker_id, args.lease_seconds):
+            try:
+                results = collect_all(base_urls, target_date, args, URLProcessor(), logger, on_saved=enqueue)
+            finally:
+                details.finish()
+    finally:
+        queue_processor.release_urls(args.worker_id)
+
+    elapsed = time.monotonic() - started
+    latencies = sorted(details.latencies)
+    logger.info("\nResumo do pipeline:")
+    logger.info(f"Vagas encontradas: {sum(len(result['jobs']) for result in results)}")
+    logger.info(f"Vagas salvas: {details.saved} | falhas: {details.failed} | tempo total {elapsed:.1f}s")
+    logger.info(f"Tempo da descoberta até a vaga salva: p50 {percentile(latencies, 50):.1f}s "
+                f"p95 {percentile(latencies, 95):.1f}s")
+    logger.info(f"Coleta da listagem pausada por fila cheia: {details.blocked_time:.1f}s")
+
+if __name__ == "__main__":
+    main()
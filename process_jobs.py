@@ -1,11 +1,23 @@
+from pipeline import DetailStage
 from src.scraper.job_scraper import JobScraper
+from src.scraper.http_job_scraper import HttpJobScraper
+from src.scraper.browser_pool import BrowserPool
+from src.scraper.async_detail_scraper import AsyncDetailScraper
+from src.scraper.resource_policy import ResourcePolicy
+from src.scraper.navigation import NavigationPolicy, WAIT_UNTIL_CHOICES
+from src.scraper.memory_governor import MemoryGovernor
 from src.data.job_processor import JobProcessor
-from src.data.url_processor import URLProcessor
+from src.data.url_processor import URLProcessor, LeaseRenewer
 from src.data.job_categorizer import JobCategorizer
+from src.utils.rate_limiter import configure_rate_limiter
+from src.utils.retry import RetryPolicy, classify_error
+from src.utils.config import (RATE_LIMIT_DELAY, RATE_LIMIT_MAX_RATE, MAX_RETRIES, MAX_URL_ATTEMPTS,
+                              CLAIM_BATCH_SIZE, LEASE_SECONDS, MAX_BROWSER_RSS_MB)
 import logging
-import time
 from typing import Optional
 import argparse
+import os
+import socket
 
 def setup_logging():
     logging.basicConfig(
@@ -14,13 +26,39 @@ def setup_logging():
     )
     return logging.getLogger(__name__)
 
-def process_single_job(url: str, job_scraper: JobScraper) -> Optional[dict]:
+def process_single_job(url: str, job_scraper: JobScraper, pool: Optional[BrowserPool] = None,
+                       use_http: bool = False, retry_policy: Optional[RetryPolicy] = None,
+                       url_processor: Optional[URLProcessor] = None) -> Optional[dict]:
     """
     Processa uma única vaga e retorna os dados coletados
+
+    Com use_http, tenta primeiro a extração via HTTP e só usa o navegador
+    se algum campo obrigatório não for encontrado. A coleta pelo navegador
+    é repetida conforme retry_policy; se todas as tentativas falharem, a
+    falha é registrada na URL via url_processor.
     """
+    retry_policy = retry_policy or RetryPolicy()
+
+    def scrape_with_browser():
+        if pool is not None:
+            with pool.page() as page:
+                return job_scraper.scrape(page)
+        return job_scraper.scrape()
+
     try:
         logging.info(f"Processando vaga: {url}")
-        job = job_scraper.fetch_jobs()
+        job = None
+        if use_http:
+            job = HttpJobScraper(url).fetch_jobs()
+            if not job:
+                logging.info(f"Extração via HTTP incompleta, usando navegador: {url}")
+        if not job:
+            try:
+                job = retry_policy.call(scrape_with_browser, url)
+            except Exception as e:
+                if url_processor is not None:
+                    url_processor.record_failure(url, str(e), classify_error(e) == 'permanent')
+                raise
         
         if job:
             # Categorizar a vaga
@@ -43,45 +81,142 @@ def main():
     
     # Configurar argumentos da linha de comando
     parser = argparse.ArgumentParser(description='Processar URLs de vagas coletadas')
-    parser.add_argument('--delay', type=int, default=1, help='Delay entre requisições em segundos')
+    parser.add_argument('--delay', type=float, default=RATE_LIMIT_DELAY,
+                        help='Intervalo inicial entre requisições ao mesmo host em segundos (ajustado automaticamente)')
+    parser.add_argument('--max-rate', type=float, default=RATE_LIMIT_MAX_RATE,
+                        help='Máximo de requisições por segundo por host')
     parser.add_argument('--limit', type=int, help='Limite de vagas para processar', default=None)
+    parser.add_argument('--pages-per-context', type=int, default=50,
+                        help='Número de vagas processadas antes de reciclar o contexto do navegador')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Número de páginas de detalhe processadas em paralelo')
+    parser.add_argument('--max-retries', type=int, default=MAX_RETRIES,
+                        help='Novas tentativas por vaga em caso de erro transitório')
+    parser.add_argument('--max-attempts', type=int, default=MAX_URL_ATTEMPTS,
+                        help='Ignora URLs cuja coleta já foi iniciada esse número de vezes sem sucesso')
+    parser.add_argument('--http', action='store_true',
+                        help='Extrai as vagas via HTTP e usa o navegador apenas como fallback')
+    parser.add_argument('--load-all-resources', action='store_true',
+                        help='Não bloqueia imagens, fontes, mídia, CSS e rastreadores')
+    parser.add_argument('--profile', default=None,
+                        help='Nome do perfil do navegador cujos cookies/armazenamento são mantidos entre execuções')
+    parser.add_argument('--no-asset-cache', action='store_true',
+                        help='Não usa o cache em disco de arquivos estáticos')
+    parser.add_argument('--wait-until', choices=WAIT_UNTIL_CHOICES, default='domcontentloaded',
+                        help='Evento da navegação aguardado antes de esperar os seletores da vaga')
+    parser.add_argument('--early-stop', action='store_true',
+                        help='Interrompe o carregamento da página assim que os seletores da vaga aparecem')
+    parser.add_argument('--max-browser-memory', type=float, default=MAX_BROWSER_RSS_MB,
+                        help='Memória (MB) dos navegadores a partir da qual o contexto é reciclado (requer psutil)')
+    parser.add_argument('--worker-id', default=f"{socket.gethostname()}-{os.getpid()}",
+                        help='Identificador deste worker nas reservas de URLs')
+    parser.add_argument('--batch-size', type=int, default=CLAIM_BATCH_SIZE,
+                        help='Número de URLs reservadas por vez')
+    parser.add_argument('--lease-seconds', type=int, default=LEASE_SECONDS,
+                        help='Validade da reserva de um lote, renovada enquanto o worker está ativo; '
+                             'depois disso outros workers podem assumi-lo')
     args = parser.parse_args()
 
+    # Todos os scrapers compartilham o limitador de taxa por host
+    configure_rate_limiter(rate=1 / args.delay if args.delay > 0 else args.max_rate, max_rate=args.max_rate)
+
     try:
         # Inicializar processors
-        url_processor = URLProcessor()
+        url_processor = URLProcessor(max_attempts=args.max_attempts)
         job_processor = JobProcessor()
 
-        # Obter URLs pendentes
-        pending_urls = url_processor.get_pending_urls()
-        
-        if not pending_urls:
+        resource_policy = ResourcePolicy(
+            enabled=not args.load_all_resources,
+            use_asset_cache=not args.no_asset_cache
+        )
+        retry_policy = RetryPolicy(max_retries=args.max_retries)
+        navigation = NavigationPolicy(wait_until=args.wait_until, early_stop=args.early_stop)
+        memory = MemoryGovernor(max_rss_mb=args.max_browser_memory)
+
+        def claim_batch(claimed):
+            # URLs são reservadas em lotes para que vários workers possam rodar em paralelo
+            batch_size = args.batch_size
+            if args.limit:
+                batch_size = min(batch_size, args.limit - claimed)
+            if batch_size <= 0:
+                return []
+            return url_processor.claim_urls(args.worker_id, batch_size, args.lease_seconds, args.max_attempts)
+
+        # Vagas coletadas do lote atual (modo sequencial): são gravadas
+        # juntas, com as URLs marcadas como processadas na mesma transação
+        scraped = []
+
+        def flush_scraped():
+            if scraped:
+                job_processor.save_jobs(scraped)
+                scraped.clear()
+
+        logger.info(f"Worker {args.worker_id}: reservando lotes de até {args.batch_size} URLs")
+        claimed = 0
+        try:
+            # Reservas renovadas enquanto o worker processa, para lotes lentos não expirarem
+            with LeaseRenewer(url_processor, args.worker_id, args.lease_seconds):
+                if args.concurrency > 1:
+                    logger.info(f"Processando com {args.concurrency} páginas simultâneas")
+                    engine = AsyncDetailScraper(
+                        concurrency=args.concurrency,
+                        pages_per_context=args.pages_per_context,
+                        resource_policy=resource_policy,
+                        http_first=args.http,
+                        retry_policy=retry_policy,
+                        profile=args.profile,
+                        navigation=navigation,
+                        memory=memory
+                    )
+                    # Um único navegador para todos os lotes: esta thread reserva os
+                    # lotes e alimenta a fila, e os workers nunca ficam sem URLs
+                    # entre um lote e outro
+                    details = DetailStage(engine, args.batch_size, max_attempts=args.max_attempts).start()
+                    try:
+                        while True:
+                            pending_urls = claim_batch(claimed)
+                            if not pending_urls:
+                                break
+                            claimed += len(pending_urls)
+                            if not all(details.put(url) for url in pending_urls):
+                                logger.error("Etapa de detalhes encerrada; as URLs restantes voltam para a fila")
+                                break
+                    finally:
+                        details.finish()
+                    logger.info(f"Vagas salvas: {details.saved} | falhas: {details.failed}")
+                else:
+                    # Processar cada URL usando um único navegador compartilhado
+                    with BrowserPool(pages_per_context=args.pages_per_context, resource_policy=resource_policy,
+                                     profile=args.profile, memory=memory) as pool:
+                        while True:
+                            pending_urls = claim_batch(claimed)
+                            if not pending_urls:
+                                break
+                            for i, url in enumerate(pending_urls, claimed + 1):
+                                logger.info(f"Processando vaga {i}: {url}")
+                                url_processor.start_attempt(url)
+
+                                # Criar scraper para esta URL
+                                scraper = JobScraper(url, navigation=navigation)
+                                job = process_single_job(url, scraper, pool, use_http=args.http,
+                                                         retry_policy=retry_policy, url_processor=url_processor)
+
+                                if job:
+                                    scraped.append(job)
+                            # Salvar no banco
+                            flush_scraped()
+                            claimed += len(pending_urls)
+                    navigation.log_stats()
+        finally:
+            # Grava o que já foi coletado; URLs reservadas e não concluídas voltam para a fila
+            flush_scraped()
+            url_processor.release_urls(args.worker_id)
+
+        if not claimed:
             logger.info("Não há URLs pendentes para processar")
             return
-        
-        logger.info(f"Encontradas {len(pending_urls)} URLs para processar")
-        
-        # Limitar número de vagas se especificado
-        if args.limit:
-            pending_urls = pending_urls[:args.limit]
+        logger.info(f"Worker {args.worker_id} processou {claimed} URLs")
 
-        # Processar cada URL
-        for i, url in enumerate(pending_urls, 1):
-            logger.info(f"Processando vaga {i}/{len(pending_urls)}: {url}")
-            
-            # Criar scraper para esta URL
-            scraper = JobScraper(url)
-            job = process_single_job(url, scraper)
-            
-            if job:
-                # Salvar no banco
-                job_processor.save_jobs([job])
-                url_processor.mark_url_as_processed(url)
-                logger.info(f"Vaga salva com sucesso: {job.get('titulo', 'Sem título')}")
-            
-            # Aguardar um pouco entre requisições
-            time.sleep(args.delay)
-        
         # Mostrar status final
         status = url_processor.get_processing_status()
         logger.info("\nStatus final do processamento:")
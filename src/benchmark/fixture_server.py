@@ -0,0 +1,224 @@
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import html
+import re
+import threading
+import time
+
+# Página de listagem com scroll infinito no mesmo formato dos cards do InfoJobs.
+# Os próximos cards são buscados em /listagem/feed quando o usuário rola a
+# página (scroll ou roda do mouse) e o fim da lista está próximo da janela.
+LISTING_TEMPLATE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head><meta charset="utf-8"><title>Vagas de emprego</title>
+<style>.js_rowCard {{ min-height: 120px; border-bottom: 1px solid #ddd; }}</style>
+</head>
+<body>
+<div id="cards">{cards}</div>
+<div id="fim"></div>
+{analytics}
+<script>
+let nextPage = 1, loading = false, done = false;
+async function maybeLoad() {{
+    if (loading || done) return;
+    const end = document.getElementById('fim').getBoundingClientRect().top;
+    if (end > window.innerHeight + 400) return;
+    loading = true;
+    try {{
+        const response = await fetch('/listagem/feed?page=' + nextPage);
+        const body = await response.text();
+        if (body.trim()) {{
+            document.getElementById('cards').insertAdjacentHTML('beforeend', body);
+            nextPage += 1;
+        }} else {{
+            done = true;
+        }}
+    }} finally {{
+        loading = false;
+    }}
+}}
+window.addEventListener('scroll', maybeLoad);
+window.addEventListener('wheel', maybeLoad);
+</script>
+</body>
+</html>
+"""
+
+CARD_TEMPLATE = """<div class="js_rowCard">
+  <div class="js_vacancyLoad" data-href="{href}">
+    <h2>{title}</h2>
+    <div class="small text-medium">{location}, {distance} Km de você</div>
+    <div class="js_date" data-value="{date}">{date}</div>
+  </div>
+</div>
+"""
+
+DETAIL_TEMPLATE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+<h2 class="js_vacancyHeaderTitle">{title}</h2>
+<div class="h4"><a href="/empresa-{index}.aspx" target="_blank">{company}</a></div>
+<div class="js_applyVacancyHidden">
+  <div class="text-medium mb-4">{location}, {distance} Km de você</div>
+  <div class="text-medium mb-4">R$ {salary_min},00 a R$ {salary_max},00 (Mensal)</div>
+</div>
+<div class="js_vacancyDataPanels">
+  <p class="mb-16 text-break">{description}</p>
+</div>
+{analytics}
+</body>
+</html>
+"""
+
+# Mantém uma requisição pendurada, como os scripts de analytics com long-polling
+ANALYTICS_SCRIPT = "<script>fetch('/analytics/collect').catch(() => null);</script>"
+
+TITLES = ('Analista de Dados', 'Desenvolvedor Python', 'Auxiliar Administrativo',
+          'Vendedor Externo', 'Engenheiro de Software', 'Assistente Financeiro')
+LOCATIONS = ('São Paulo - SP', 'Campinas - SP', 'Rio de Janeiro - RJ', 'Belo Horizonte - MG')
+
+DETAIL_PATH = re.compile(r'^/vaga-de-[a-z-]+-(\d+)\.aspx$')
+
+class FixtureServer:
+    """
+    Servidor HTTP local que simula o InfoJobs para medir os scrapers sem
+    acessar o site: uma listagem com `cards` vagas sintéticas servidas em
+    páginas de `page_size` cards pelo scroll infinito, e as páginas de
+    detalhe de cada vaga com os seletores usados por JobScraper.
+
+    As vagas são publicadas a partir de hoje, um segundo antes da anterior;
+    depois da última, um card antigo encerra a coleta pela data alvo.
+    `latency` (segundos) atrasa cada resposta e `analytics_delay` inclui nas
+    páginas uma requisição que fica pendente por esse tempo.
+    """
+
+    def __init__(self, cards: int = 500, page_size: int = 20, latency: float = 0,
+                 analytics_delay: float = 0, host: str = '127.0.0.1', port: int = 0):
+        self.cards = cards
+        self.page_size = page_size
+        self.latency = latency
+        self.analytics_delay = analytics_delay
+        self.newest = datetime.now().replace(hour=23, minute=59, second=59, microsecond=0)
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def listing_url(self) -> str:
+        return f"{self.url}/listagem"
+
+    @property
+    def target_date(self):
+        """
+        Data alvo que faz a coleta parar exatamente após as `cards` vagas
+        """
+        return (self.newest - timedelta(seconds=self.cards - 1)).date()
+
+    def detail_path(self, index: int) -> str:
+        slug = TITLES[index % len(TITLES)].lower().replace(' ', '-')
+        return f"/vaga-de-{slug}-{index}.aspx"
+
+    def detail_urls(self):
+        return [f"{self.url}{self.detail_path(index)}" for index in range(self.cards)]
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _analytics(self) -> str:
+        return ANALYTICS_SCRIPT if self.analytics_delay > 0 else ''
+
+    def _card(self, index: int) -> str:
+        if index < self.cards:
+            posted = self.newest - timedelta(seconds=index)
+        else:
+            posted = datetime(2000, 1, 1)
+        return CARD_TEMPLATE.format(
+            href=self.detail_path(index),
+            title=html.escape(TITLES[index % len(TITLES)]),
+            location=html.escape(LOCATIONS[index % len(LOCATIONS)]),
+            distance=index % 50,
+            date=posted.strftime('%Y/%m/%d %H:%M:%S')
+        )
+
+    def listing_page(self, page: int) -> str:
+        """
+        Cards da página `page` da listagem (a 0 vem no HTML inicial)
+        """
+        start = page * self.page_size
+        # O card de índice `cards` é o card antigo que encerra a coleta
+        end = min(start + self.page_size, self.cards + 1)
+        return ''.join(self._card(index) for index in range(start, end))
+
+    def detail_page(self, index: int) -> str:
+        title = TITLES[index % len(TITLES)]
+        return DETAIL_TEMPLATE.format(
+            index=index,
+            title=html.escape(f"{title} {index}"),
+            company=html.escape(f"Empresa {index % 97}"),
+            location=html.escape(LOCATIONS[index % len(LOCATIONS)]),
+            distance=index % 50,
+            salary_min=2000 + (index % 10) * 500,
+            salary_max=3000 + (index % 10) * 500,
+            description=html.escape(f"Vaga sintética {index} para benchmark. " * 40),
+            analytics=self._analytics()
+        )
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                parsed = urlparse(self.path)
+                if parsed.path == '/listagem':
+                    self._send(LISTING_TEMPLATE.format(cards=server.listing_page(0), analytics=server._analytics()))
+                elif parsed.path == '/listagem/feed':
+                    page = int(parse_qs(parsed.query).get('page', ['1'])[0])
+                    self._send(server.listing_page(page))
+                elif parsed.path == '/analytics/collect':
+                    time.sleep(server.analytics_delay)
+                    self._send('', 'text/plain')
+                else:
+                    match = DETAIL_PATH.match(parsed.path)
+                    if match and int(match.group(1)) < server.cards:
+                        self._send(server.detail_page(int(match.group(1))))
+                    else:
+                        self._send('Página não encontrada', 'text/plain', 404)
+
+            def _send(self, body: str, content_type: str = 'text/html', status: int = 200):
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                # Os acessos não são registrados para não poluir a saída do benchmark
+                pass
+
+        return Handler
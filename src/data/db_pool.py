@@ -0,0 +1,142 @@
+import atexit
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+import psycopg2
+from psycopg2 import extensions, pool
+from dotenv import load_dotenv
+
+from src.utils.config import DB_POOL_MIN_CONNECTIONS, DB_POOL_MAX_CONNECTIONS, DB_HEALTH_CHECK_INTERVAL
+
+load_dotenv()
+
+class ConnectionPool:
+    """
+    Pool de conexões com o Postgres compartilhado por todo o processo.
+
+    Limita o número de conexões abertas a `max_connections`: quem pede uma
+    conexão com o pool cheio espera até outra ser devolvida. Conexões
+    paradas há mais de `health_check_interval` segundos são testadas com
+    SELECT 1 antes de serem entregues, e as que caíram são descartadas.
+    """
+
+    def __init__(self, min_connections: int = DB_POOL_MIN_CONNECTIONS,
+                 max_connections: int = DB_POOL_MAX_CONNECTIONS,
+                 health_check_interval: float = DB_HEALTH_CHECK_INTERVAL):
+        self.max_connections = max_connections
+        self.health_check_interval = health_check_interval
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._pool = pool.ThreadedConnectionPool(
+            min_connections,
+            max_connections,
+            user=os.getenv("user"),
+            password=os.getenv("password"),
+            host=os.getenv("host"),
+            port=os.getenv("port"),
+            dbname=os.getenv("dbname")
+        )
+        # ThreadedConnectionPool falha em vez de esperar quando está cheio
+        self._available = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._last_used = {}
+
+    def _healthy(self, conn) -> bool:
+        if conn.closed:
+            return False
+        with self._lock:
+            last_used = self._last_used.get(id(conn))
+        if last_used is not None and time.monotonic() - last_used < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _discard(self, conn) -> None:
+        with self._lock:
+            self._last_used.pop(id(conn), None)
+        self._pool.putconn(conn, close=True)
+
+    def getconn(self):
+        """
+        Retorna uma conexão válida do pool (prefira o context manager connection())
+        """
+        self._available.acquire()
+        try:
+            # Cada conexão morta é descartada; no pior caso todas as ociosas
+            # caíram e o pool abre uma nova
+            for _ in range(self.max_connections + 1):
+                conn = self._pool.getconn()
+                if self._healthy(conn):
+                    return conn
+                self.logger.warning("Conexão com o banco inválida descartada")
+                self._discard(conn)
+            raise psycopg2.OperationalError("Não foi possível obter uma conexão válida com o banco")
+        except Exception:
+            self._available.release()
+            raise
+
+    def putconn(self, conn) -> None:
+        """
+        Devolve uma conexão ao pool, desfazendo transações deixadas abertas
+        """
+        try:
+            if not conn.closed and conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except psycopg2.Error:
+            pass
+        try:
+            if conn.closed:
+                self._discard(conn)
+            else:
+                with self._lock:
+                    self._last_used[id(conn)] = time.monotonic()
+                self._pool.putconn(conn)
+        finally:
+            self._available.release()
+
+    @contextmanager
+    def connection(self):
+        """
+        Empresta uma conexão durante o bloco `with`
+        """
+        conn = self.getconn()
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def close(self) -> None:
+        if not self._pool.closed:
+            self._pool.closeall()
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> ConnectionPool:
+    """
+    Retorna o pool do processo, criando-o no primeiro uso
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool()
+            atexit.register(close_pool)
+        return _pool
+
+def close_pool() -> None:
+    """
+    Fecha todas as conexões do pool do processo
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
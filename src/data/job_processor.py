@@ -19,12 +19,14 @@ class JobProcessor:
     
     def save_jobs(self, jobs):
         """
-        Salva as vagas no banco de dados
+        Salva as vagas no banco de dados em um único lote e marca suas URLs
+        como processadas na mesma transação
         """
         if isinstance(jobs, dict):
             jobs = [jobs]
-        
-        saved_count = 0
+        if not jobs:
+            return 0
+
         for job in jobs:
             # Adiciona categorias à vaga
             categories = self.categorizer.categorize_job(job)
@@ -33,11 +35,14 @@ class JobProcessor:
             # Adiciona hierarquia à vaga
             hierarchies = self.categorizer.classify_hierarchy(job)
             job['hierarchy'] = ','.join(hierarchies)  # Converte lista em string
-            
-            if self.db.insert_job(job):
-                saved_count += 1
-                self.logger.info(f"Vaga salva: {job.get('titulo', 'Sem título')} | Categorias: {job['category']} | Hierarquia: {job['hierarchy']}")
-        
+
+        saved_count = self.db.upsert_jobs(jobs)
+        if saved_count is None:
+            self.logger.error(f"Falha ao salvar lote de {len(jobs)} vagas")
+            return 0
+
+        for job in jobs:
+            self.logger.info(f"Vaga salva: {job.get('titulo', 'Sem título')} | Categorias: {job['category']} | Hierarquia: {job['hierarchy']}")
         self.logger.info(f"Salvas {saved_count} vagas no banco de dados")
         return saved_count
 
@@ -0,0 +1,126 @@
+import logging
+from typing import List, Tuple
+
+# Migrações do schema em ordem de versão. Cada uma roda uma única vez por
+# banco, dentro da mesma transação que registra a versão em
+# schema_migrations. Migrações já aplicadas nunca devem ser alteradas:
+# mudanças novas entram como uma nova versão no fim da lista.
+#
+# As primeiras versões usam IF NOT EXISTS para adotar bancos criados antes
+# do controle de versões.
+MIGRATIONS: List[Tuple[int, str, List[str]]] = [
+    (1, "Tabelas de URLs e vagas", [
+        """
+        CREATE TABLE IF NOT EXISTS urls (
+            id SERIAL PRIMARY KEY,
+            url TEXT UNIQUE NOT NULL,
+            location TEXT,
+            posted_date TIMESTAMP,
+            collected_at TIMESTAMP,
+            processed BOOLEAN DEFAULT FALSE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id SERIAL PRIMARY KEY,
+            url TEXT UNIQUE NOT NULL,
+            title TEXT,
+            company TEXT,
+            location TEXT,
+            salary TEXT,
+            description TEXT,
+            category TEXT,
+            hierarchy TEXT,
+            collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (url) REFERENCES urls(url)
+        )
+        """
+    ]),
+    (2, "Controle de falhas por URL", [
+        "ALTER TABLE urls ADD COLUMN IF NOT EXISTS attempts INTEGER DEFAULT 0",
+        "ALTER TABLE urls ADD COLUMN IF NOT EXISTS last_error TEXT"
+    ]),
+    (3, "Reserva das URLs pelos workers", [
+        "ALTER TABLE urls ADD COLUMN IF NOT EXISTS claimed_by TEXT",
+        "ALTER TABLE urls ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP"
+    ]),
+    (4, "Checkpoints da coleta da listagem", [
+        """
+        CREATE TABLE IF NOT EXISTS crawl_checkpoints (
+            base_url TEXT PRIMARY KEY,
+            last_posted_date TIMESTAMP,
+            card_cursor INTEGER NOT NULL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    ]),
+    (5, "Índices das consultas de fila, listagem e status", [
+        # Fila de pendentes (get_pending_urls, claim_urls): só as linhas não
+        # processadas entram no índice, que fica pequeno com a tabela grande
+        """
+        CREATE INDEX IF NOT EXISTS idx_urls_pending
+        ON urls (posted_date DESC NULLS LAST)
+        WHERE processed = FALSE
+        """,
+        # release_urls procura as reservas de um worker
+        """
+        CREATE INDEX IF NOT EXISTS idx_urls_claimed_by
+        ON urls (claimed_by)
+        WHERE claimed_by IS NOT NULL
+        """,
+        # get_processed_jobs e get_known_urls filtram/ordenam pela publicação
+        "CREATE INDEX IF NOT EXISTS idx_urls_posted_date ON urls (posted_date DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_jobs_collected_at ON jobs (collected_at DESC)",
+        # get_processing_status agrupa por localização
+        "CREATE INDEX IF NOT EXISTS idx_urls_location ON urls (location)"
+    ]),
+]
+
+# Chave do advisory lock que impede dois processos de migrarem ao mesmo tempo
+MIGRATIONS_LOCK_KEY = 727100
+
+logger = logging.getLogger(__name__)
+
+def current_version(cursor) -> int:
+    """
+    Maior versão aplicada no banco (0 se nenhuma)
+    """
+    cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+    return cursor.fetchone()[0]
+
+def apply_migrations(cursor) -> List[int]:
+    """
+    Aplica as migrações pendentes em ordem e retorna as versões aplicadas.
+    Deve rodar em uma transação: o commit fica a cargo de quem chama.
+    """
+    # Outros processos esperam aqui e depois encontram as versões já aplicadas
+    cursor.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATIONS_LOCK_KEY,))
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            description TEXT,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    version = current_version(cursor)
+
+    applied = []
+    for number, description, statements in sorted(MIGRATIONS):
+        if number <= version:
+            continue
+        logger.info(f"Aplicando migração {number}: {description}")
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.execute(
+            "INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+            (number, description)
+        )
+        applied.append(number)
+    return applied
+
+if __name__ == '__main__':
+    from src.data.supabase_client import SupabaseClient
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    with SupabaseClient().cursor() as cursor:
+        print(f"Versão do schema: {current_version(cursor)} (mais recente: {max(m[0] for m in MIGRATIONS)})")
@@ -1,167 +1,491 @@
-import os
+import threading
+import uuid
+from contextlib import contextmanager
 import psycopg2
-from dotenv import load_dotenv
-from typing import List, Dict
+from psycopg2.extras import execute_values
+from typing import Dict, Iterator, List, Sequence
+from src.utils.config import DB_INSERT_CHUNK_SIZE, DB_ITERSIZE
+from .db_pool import get_pool
+from .migrations import apply_migrations
 
-load_dotenv()
+# O schema é verificado uma vez por processo, não a cada cliente criado
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+# Colunas que podem ser pedidas nas consultas de vagas e a expressão SQL de cada uma
+JOB_COLUMNS = {
+    'id': 'j.id',
+    'url': 'j.url',
+    'title': 'j.title',
+    'company': 'j.company',
+    'location': 'j.location',
+    'salary': 'j.salary',
+    'description': 'j.description',
+    'category': 'j.category',
+    'hierarchy': 'j.hierarchy',
+    'collected_at': 'j.collected_at',
+    'posted_date': 'u.posted_date'
+}
+ALL_JOBS_COLUMNS = ('url', 'title', 'company', 'location', 'salary', 'description', 'category', 'hierarchy',
+                    'collected_at')
+PROCESSED_JOBS_COLUMNS = ALL_JOBS_COLUMNS + ('posted_date',)
 
 class SupabaseClient:
     def __init__(self):
-        self.connection = psycopg2.connect(
-            user=os.getenv("user"),
-            password=os.getenv("password"),
-            host=os.getenv("host"),
-            port=os.getenv("port"),
-            dbname=os.getenv("dbname")
-        )
-        self.cursor = self.connection.cursor()
-        self._create_tables_if_not_exist()
+        # As conexões vêm do pool do processo: criar vários clientes é barato
+        self.pool = get_pool()
+        self._ensure_schema()
+
+    @contextmanager
+    def connection(self):
+        """
+        Empresta uma conexão do pool durante o bloco `with`
+        """
+        with self.pool.connection() as conn:
+            yield conn
+
+    @contextmanager
+    def cursor(self):
+        """
+        Cursor em uma conexão do pool: faz commit ao final do bloco ou
+        rollback se ele levantar uma exceção
+        """
+        with self.pool.connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    yield cursor
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+    @contextmanager
+    def server_cursor(self, itersize: int = DB_ITERSIZE):
+        """
+        Cursor nomeado (server-side): o resultado fica no servidor e é
+        trazido em blocos de `itersize` linhas conforme é iterado, em vez de
+        carregado inteiro na memória pelo fetchall
+        """
+        with self.pool.connection() as conn:
+            cursor = conn.cursor(name=f"stream_{uuid.uuid4().hex}")
+            cursor.itersize = itersize
+            try:
+                yield cursor
+            finally:
+                try:
+                    cursor.close()
+                except psycopg2.Error:
+                    # Transação abortada: o pool desfaz ao receber a conexão
+                    pass
 
-    def _create_tables_if_not_exist(self):
+    def _ensure_schema(self):
+        global _schema_ready
+        with _schema_lock:
+            if not _schema_ready:
+                _schema_ready = self._apply_migrations()
+
+    def _apply_migrations(self):
         """
-        Cria as tabelas necessárias se não existirem
+        Aplica as migrações pendentes do schema (ver migrations.py)
         """
         try:
-            # Tabela de URLs
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS urls (
-                    id SERIAL PRIMARY KEY,
-                    url TEXT UNIQUE NOT NULL,
-                    location TEXT,
-                    posted_date TIMESTAMP,
-                    collected_at TIMESTAMP,
-                    processed BOOLEAN DEFAULT FALSE
-                )
-            """)
-
-            # Tabela de vagas
-            self.cursor.execute("""
-                CREATE TABLE IF NOT EXISTS jobs (
-                    id SERIAL PRIMARY KEY,
-                    url TEXT UNIQUE NOT NULL,
-                    title TEXT,
-                    company TEXT,
-                    location TEXT,
-                    salary TEXT,
-                    description TEXT,
-                    category TEXT,
-                    hierarchy TEXT,
-                    collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (url) REFERENCES urls(url)
-                )
-            """)
-            
-            self.connection.commit()
+            with self.cursor() as cursor:
+                applied = apply_migrations(cursor)
+            if applied:
+                print(f"Migrações aplicadas: {applied}")
+            return True
         except Exception as e:
-            print(f"Erro ao criar tabelas: {e}")
-            self.connection.rollback()
+            print(f"Erro ao aplicar migrações: {e}")
+            return False
 
-    def insert_jobs(self, jobs_data: List[Dict]):
+    def insert_jobs(self, jobs_data: List[Dict], chunk_size: int = DB_INSERT_CHUNK_SIZE):
         """
-        Insere dados de vagas no Supabase
+        Insere as URLs das vagas no Supabase em INSERTs de várias linhas
+        (`chunk_size` por comando), em uma única transação.
+
+        Retorna {'inserted': n, 'skipped': m}, onde skipped conta as URLs que
+        já existiam; None em caso de erro.
         """
         try:
-            for job in jobs_data:
-                self.cursor.execute(
-                    """
-                    INSERT INTO urls (url, location, posted_date, collected_at, processed)
-                    VALUES (%s, %s, %s, %s, %s)
-                    ON CONFLICT (url) DO NOTHING
-                    """,
-                    (job['url'], job['location'], job['date'], job['collected_at'], False)
-                )
-            self.connection.commit()
-            return True
+            with self.cursor() as cursor:
+                inserted = 0
+                for start in range(0, len(jobs_data), chunk_size):
+                    chunk = jobs_data[start:start + chunk_size]
+                    rows = execute_values(
+                        cursor,
+                        """
+                        INSERT INTO urls (url, location, posted_date, collected_at, processed)
+                        VALUES %s
+                        ON CONFLICT (url) DO NOTHING
+                        RETURNING url
+                        """,
+                        [(job['url'], job['location'], job['date'], job['collected_at'], False) for job in chunk],
+                        page_size=len(chunk),
+                        fetch=True
+                    )
+                    inserted += len(rows)
+                return {'inserted': inserted, 'skipped': len(jobs_data) - inserted}
         except Exception as e:
             print(f"Erro ao inserir vagas: {e}")
-            self.connection.rollback()
-            return False
+            return None
 
     def insert_job(self, job_data: Dict):
         """
         Insere dados de uma vaga específica
         """
         try:
-            self.cursor.execute(
-                """
-                INSERT INTO jobs (url, title, company, location, salary, description, category, hierarchy)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (url) 
-                DO UPDATE SET
-                    title = EXCLUDED.title,
-                    company = EXCLUDED.company,
-                    location = EXCLUDED.location,
-                    salary = EXCLUDED.salary,
-                    description = EXCLUDED.description,
-                    category = EXCLUDED.category,
-                    hierarchy = EXCLUDED.hierarchy,
-                    collected_at = CURRENT_TIMESTAMP
-                """,
-                (
-                    job_data['url'],
-                    job_data.get('titulo'),
-                    job_data.get('empresa'),
-                    job_data.get('local'),
-                    job_data.get('salario'),
-                    job_data.get('descricao'),
-                    job_data.get('category'),
-                    job_data.get('hierarchy')
+            with self.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO jobs (url, title, company, location, salary, description, category, hierarchy)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (url) 
+                    DO UPDATE SET
+                        title = EXCLUDED.title,
+                        company = EXCLUDED.company,
+                        location = EXCLUDED.location,
+                        salary = EXCLUDED.salary,
+                        description = EXCLUDED.description,
+                        category = EXCLUDED.category,
+                        hierarchy = EXCLUDED.hierarchy,
+                        collected_at = CURRENT_TIMESTAMP
+                    """,
+                    (
+                        job_data['url'],
+                        job_data.get('titulo'),
+                        job_data.get('empresa'),
+                        job_data.get('local'),
+                        job_data.get('salario'),
+                        job_data.get('descricao'),
+                        job_data.get('category'),
+                        job_data.get('hierarchy')
+                    )
                 )
-            )
-            self.connection.commit()
-            return True
+                return True
         except Exception as e:
             print(f"Erro ao inserir vaga: {e}")
-            self.connection.rollback()
             return False
 
-    def get_pending_urls(self):
+    def upsert_jobs(self, jobs_data: List[Dict], chunk_size: int = DB_INSERT_CHUNK_SIZE):
+        """
+        Grava um lote de vagas processadas e marca suas URLs como
+        processadas na mesma transação, com um INSERT de várias linhas por
+        `chunk_size` vagas. Se o worker cair no meio do lote, nenhuma das
+        tabelas fica com o lote pela metade.
+
+        Retorna o número de vagas gravadas ou None em caso de erro.
+        """
+        # Uma vaga repetida no mesmo comando quebraria o ON CONFLICT DO UPDATE
+        jobs_by_url = {job['url']: job for job in jobs_data}
+        jobs = list(jobs_by_url.values())
+        try:
+            with self.cursor() as cursor:
+                for start in range(0, len(jobs), chunk_size):
+                    chunk = jobs[start:start + chunk_size]
+                    execute_values(
+                        cursor,
+                        """
+                        INSERT INTO jobs (url, title, company, location, salary, description, category, hierarchy)
+                        VALUES %s
+                        ON CONFLICT (url)
+                        DO UPDATE SET
+                            title = EXCLUDED.title,
+                            company = EXCLUDED.company,
+                            location = EXCLUDED.location,
+                            salary = EXCLUDED.salary,
+                            description = EXCLUDED.description,
+                            category = EXCLUDED.category,
+                            hierarchy = EXCLUDED.hierarchy,
+                            collected_at = CURRENT_TIMESTAMP
+                        """,
+                        [
+                            (
+                                job['url'],
+                                job.get('titulo'),
+                                job.get('empresa'),
+                                job.get('local'),
+                                job.get('salario'),
+                                job.get('descricao'),
+                                job.get('category'),
+                                job.get('hierarchy')
+                            )
+                            for job in chunk
+                        ],
+                        page_size=len(chunk)
+                    )
+                    cursor.execute(
+                        """
+                        UPDATE urls
+                        SET processed = TRUE,
+                            lease_expires_at = NULL
+                        WHERE url = ANY(%s)
+                        """,
+                        ([job['url'] for job in chunk],)
+                    )
+                return len(jobs)
+        except Exception as e:
+            print(f"Erro ao gravar lote de vagas: {e}")
+            return None
+
+    def get_pending_urls(self, max_attempts: int = None):
         """
         Retorna URLs que ainda não foram processadas
+
+        Com max_attempts, ignora URLs que já falharam esse número de vezes
         """
         try:
-            self.cursor.execute(
-                """
-                SELECT url 
-                FROM urls
-                WHERE processed = FALSE
-                """
-            )
-            return [row[0] for row in self.cursor.fetchall()]
+            with self.cursor() as cursor:
+                if max_attempts is None:
+                    cursor.execute(
+                        """
+                        SELECT url 
+                        FROM urls
+                        WHERE processed = FALSE
+                        """
+                    )
+                else:
+                    cursor.execute(
+                        """
+                        SELECT url 
+                        FROM urls
+                        WHERE processed = FALSE
+                          AND COALESCE(attempts, 0) < %s
+                        """,
+                        (max_attempts,)
+                    )
+                return [row[0] for row in cursor.fetchall()]
         except Exception as e:
             print(f"Erro ao buscar URLs pendentes: {e}")
             return []
 
-    def get_all_jobs(self):
+    def claim_urls(self, worker_id: str, batch_size: int, lease_seconds: int, max_attempts: int = None,
+                   urls: List[str] = None):
         """
-        Retorna todas as vagas processadas
+        Reserva um lote de URLs pendentes para o worker e retorna a lista.
+
+        URLs reservadas por outro worker são ignoradas (SKIP LOCKED) até a
+        reserva expirar, o que permite vários processos em paralelo sem
+        trabalho duplicado; reservas vencidas voltam automaticamente à fila.
+        Com `urls`, apenas essas URLs são consideradas.
+
+        A reserva não conta tentativas: elas são contadas por start_attempt
+        quando a coleta de cada URL começa, então URLs devolvidas sem serem
+        tentadas (interrupção, worker encerrado) não perdem tentativas.
         """
+        only_urls = "AND url = ANY(%s)" if urls is not None else ""
+        params = [worker_id, lease_seconds, max_attempts, max_attempts]
+        if urls is not None:
+            params.append(list(urls))
+        params.append(batch_size)
         try:
-            self.cursor.execute(
-                """
-                SELECT 
-                    j.url,
-                    j.title,
-                    j.company,
-                    j.location,
-                    j.salary,
-                    j.description,
-                    j.category,
-                    j.hierarchy,
-                    j.collected_at
-                FROM jobs j
-                """
-            )
-            columns = ['url', 'title', 'company', 'location', 'salary', 'description', 'category', 'hierarchy', 'collected_at']
-            jobs = []
-            for row in self.cursor.fetchall():
-                job = dict(zip(columns, row))
-                if job['category']:
-                    job['category'] = job['category'].split(',')
+            with self.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    UPDATE urls
+                    SET claimed_by = %s,
+                        lease_expires_at = NOW() + %s * INTERVAL '1 second'
+                    WHERE id IN (
+                        SELECT id
+                        FROM urls
+                        WHERE processed = FALSE
+                          AND (lease_expires_at IS NULL OR lease_expires_at < NOW())
+                          AND (%s IS NULL OR COALESCE(attempts, 0) < %s)
+                          {only_urls}
+                        ORDER BY posted_date DESC NULLS LAST
+                        LIMIT %s
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING url
+                    """,
+                    params
+                )
+                urls = [row[0] for row in cursor.fetchall()]
+                return urls
+        except Exception as e:
+            print(f"Erro ao reservar URLs: {e}")
+            return []
+
+    def release_urls(self, worker_id: str):
+        """
+        Libera as reservas ainda abertas do worker (ex.: ao encerrar o processo)
+        """
+        try:
+            with self.cursor() as cursor:
+                cursor.execute(
+                    """
+                    UPDATE urls
+                    SET claimed_by = NULL,
+                        lease_expires_at = NULL
+                    WHERE claimed_by = %s
+                      AND processed = FALSE
+                    """,
+                    (worker_id,)
+                )
+                released = cursor.rowcount
+                return released
+        except Exception as e:
+            print(f"Erro ao liberar URLs reservadas: {e}")
+            return 0
+
+    def start_attempt(self, url: str):
+        """
+        Conta uma tentativa para a URL ao iniciar sua coleta. Uma URL que
+        derruba o worker antes de a falha ser registrada também esgota
+        max_attempts.
+        """
+        try:
+            with self.cursor() as cursor:
+                cursor.execute(
+                    "UPDATE urls SET attempts = COALESCE(attempts, 0) + 1 WHERE url = %s",
+                    (url,)
+                )
+                return True
+        except Exception as e:
+            print(f"Erro ao registrar tentativa da URL: {e}")
+            return False
+
+    def renew_leases(self, worker_id: str, lease_seconds: int):
+        """
+        Estende as reservas ainda abertas do worker por mais `lease_seconds`
+        """
+        try:
+            with self.cursor() as cursor:
+                cursor.execute(
+                    """
+                    UPDATE urls
+                    SET lease_expires_at = NOW() + %s * INTERVAL '1 second'
+                    WHERE claimed_by = %s
+                      AND processed = FALSE
+                    """,
+                    (lease_seconds, worker_id)
+                )
+                return cursor.rowcount
+        except Exception as e:
+            print(f"Erro ao renovar reservas: {e}")
+            return 0
+
+    def get_known_urls(self, since=None):
+        """
+        Retorna o conjunto de URLs já armazenadas, opcionalmente apenas as
+        publicadas a partir de `since`
+        """
+        try:
+            with self.cursor() as cursor:
+                if since is None:
+                    cursor.execute("SELECT url FROM urls")
                 else:
-                    job['category'] = []
-                jobs.append(job)
-            return jobs
+                    cursor.execute(
+                        """
+                        SELECT url
+                        FROM urls
+                        WHERE posted_date >= %s OR posted_date IS NULL
+                        """,
+                        (since,)
+                    )
+                return {row[0] for row in cursor.fetchall()}
+        except Exception as e:
+            print(f"Erro ao buscar URLs conhecidas: {e}")
+            return set()
+
+    def get_latest_posted_date(self):
+        """
+        Retorna a data de publicação mais recente entre as URLs armazenadas
+        """
+        try:
+            with self.cursor() as cursor:
+                cursor.execute("SELECT MAX(posted_date) FROM urls")
+                return cursor.fetchone()[0]
+        except Exception as e:
+            print(f"Erro ao buscar data mais recente: {e}")
+            return None
+
+    def save_checkpoint(self, base_url: str, last_posted_date, card_cursor: int):
+        """
+        Grava a posição atual da coleta de uma listagem
+        """
+        try:
+            with self.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO crawl_checkpoints (base_url, last_posted_date, card_cursor, updated_at)
+                    VALUES (%s, %s, %s, CURRENT_TIMESTAMP)
+                    ON CONFLICT (base_url)
+                    DO UPDATE SET
+                        last_posted_date = EXCLUDED.last_posted_date,
+                        card_cursor = EXCLUDED.card_cursor,
+                        updated_at = CURRENT_TIMESTAMP
+                    """,
+                    (base_url, last_posted_date, card_cursor)
+                )
+                return True
+        except Exception as e:
+            print(f"Erro ao gravar checkpoint da coleta: {e}")
+            return False
+
+    def get_checkpoint(self, base_url: str):
+        """
+        Retorna o checkpoint de uma listagem ou None se não houver
+        """
+        try:
+            with self.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT last_posted_date, card_cursor, updated_at
+                    FROM crawl_checkpoints
+                    WHERE base_url = %s
+                    """,
+                    (base_url,)
+                )
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+                return dict(zip(['last_posted_date', 'card_cursor', 'updated_at'], row))
+        except Exception as e:
+            print(f"Erro ao buscar checkpoint da coleta: {e}")
+            return None
+
+    def delete_checkpoint(self, base_url: str):
+        """
+        Remove o checkpoint de uma listagem cuja coleta terminou
+        """
+        try:
+            with self.cursor() as cursor:
+                cursor.execute("DELETE FROM crawl_checkpoints WHERE base_url = %s", (base_url,))
+                return True
+        except Exception as e:
+            print(f"Erro ao remover checkpoint da coleta: {e}")
+            return False
+
+    def _select_jobs(self, columns: Sequence[str]) -> str:
+        unknown = [column for column in columns if column not in JOB_COLUMNS]
+        if unknown:
+            raise ValueError(f"Colunas desconhecidas: {unknown}")
+        return ', '.join(JOB_COLUMNS[column] for column in columns)
+
+    def _job_from_row(self, columns: Sequence[str], row) -> Dict:
+        job = dict(zip(columns, row))
+        if 'category' in job:
+            job['category'] = job['category'].split(',') if job['category'] else []
+        return job
+
+    def iter_all_jobs(self, columns: Sequence[str] = ALL_JOBS_COLUMNS,
+                      itersize: int = DB_ITERSIZE) -> Iterator[Dict]:
+        """
+        Percorre todas as vagas, mais recentes primeiro, sem carregar a
+        tabela inteira na memória. `columns` limita as colunas trazidas do
+        banco (ex.: sem 'description'). Erros do banco são levantados.
+        """
+        with self.server_cursor(itersize) as cursor:
+            cursor.execute(f"SELECT {self._select_jobs(columns)} FROM jobs j ORDER BY j.collected_at DESC")
+            for row in cursor:
+                yield self._job_from_row(columns, row)
+
+    def get_all_jobs(self, columns: Sequence[str] = ALL_JOBS_COLUMNS):
+        """
+        Retorna todas as vagas processadas
+        """
+        try:
+            return list(self.iter_all_jobs(columns))
         except Exception as e:
             print(f"Erro ao buscar vagas processadas: {e}")
             return []
@@ -171,57 +495,49 @@ class SupabaseClient:
         Retorna URLs não processadas com informações adicionais
         """
         try:
-            self.cursor.execute(
-                """
-                SELECT 
-                    url,
-                    location,
-                    posted_date,
-                    collected_at
-                FROM urls
-                WHERE processed = FALSE
-                ORDER BY collected_at DESC
-                """
-            )
-            return self.cursor.fetchall()
+            with self.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT 
+                        url,
+                        location,
+                        posted_date,
+                        collected_at
+                    FROM urls
+                    WHERE processed = FALSE
+                    ORDER BY collected_at DESC
+                    """
+                )
+                return cursor.fetchall()
         except Exception as e:
             print(f"Erro ao buscar URLs não processadas: {e}")
             return []
 
-    def get_processed_jobs(self):
+    def iter_processed_jobs(self, columns: Sequence[str] = PROCESSED_JOBS_COLUMNS,
+                            itersize: int = DB_ITERSIZE) -> Iterator[Dict]:
         """
-        Retorna todas as vagas que foram processadas (processed = True)
+        Percorre as vagas processadas (processed = True) em blocos de
+        `itersize` linhas, como iter_all_jobs
         """
-        try:
-            self.cursor.execute(
-                """
-                SELECT 
-                    j.url,
-                    j.title,
-                    j.company,
-                    j.location,
-                    j.salary,
-                    j.description,
-                    j.category,
-                    j.hierarchy,
-                    j.collected_at,
-                    u.posted_date
+        with self.server_cursor(itersize) as cursor:
+            cursor.execute(
+                f"""
+                SELECT {self._select_jobs(columns)}
                 FROM jobs j
                 INNER JOIN urls u ON j.url = u.url
                 WHERE u.processed = TRUE
                 ORDER BY u.posted_date DESC, j.collected_at DESC
                 """
             )
-            columns = ['url', 'title', 'company', 'location', 'salary', 'description', 'category', 'hierarchy', 'collected_at', 'posted_date']
-            jobs = []
-            for row in self.cursor.fetchall():
-                job = dict(zip(columns, row))
-                if job['category']:
-                    job['category'] = job['category'].split(',')
-                else:
-                    job['category'] = []
-                jobs.append(job)
-            return jobs
+            for row in cursor:
+                yield self._job_from_row(columns, row)
+
+    def get_processed_jobs(self, columns: Sequence[str] = PROCESSED_JOBS_COLUMNS):
+        """
+        Retorna todas as vagas que foram processadas (processed = True)
+        """
+        try:
+            return list(self.iter_processed_jobs(columns))
         except Exception as e:
             print(f"Erro ao buscar vagas processadas: {e}")
             return []
@@ -231,19 +547,43 @@ class SupabaseClient:
         Marca uma vaga como processada
         """
         try:
-            self.cursor.execute(
-                """
-                UPDATE urls
-                SET processed = TRUE
-                WHERE url = %s
-                """,
-                (url,)
-            )
-            self.connection.commit()
-            return True
+            with self.cursor() as cursor:
+                cursor.execute(
+                    """
+                    UPDATE urls
+                    SET processed = TRUE,
+                        lease_expires_at = NULL
+                    WHERE url = %s
+                    """,
+                    (url,)
+                )
+                return True
         except Exception as e:
             print(f"Erro ao marcar vaga como processada: {e}")
-            self.connection.rollback()
+            return False
+
+    def record_failure(self, url: str, error: str, min_attempts: int = 0):
+        """
+        Registra uma falha ao processar a URL. A tentativa já foi contada ao
+        iniciar a coleta (start_attempt), e a reserva é mantida até expirar
+        ou o worker encerrar: o mesmo worker não volta a pegar a URL na
+        mesma execução.
+        min_attempts permite marcar de uma vez uma URL com erro permanente.
+        """
+        try:
+            with self.cursor() as cursor:
+                cursor.execute(
+                    """
+                    UPDATE urls
+                    SET attempts = GREATEST(COALESCE(attempts, 0), %s),
+                        last_error = %s
+                    WHERE url = %s
+                    """,
+                    (min_attempts, error[:1000], url)
+                )
+                return True
+        except Exception as e:
+            print(f"Erro ao registrar falha da vaga: {e}")
             return False
 
     def get_processing_status(self):
@@ -251,29 +591,30 @@ class SupabaseClient:
         Retorna o status atual do processamento
         """
         try:
-            # Total de vagas
-            self.cursor.execute("SELECT COUNT(*) FROM urls")
-            total = self.cursor.fetchone()[0]
+            with self.cursor() as cursor:
+                # Total de vagas
+                cursor.execute("SELECT COUNT(*) FROM urls")
+                total = cursor.fetchone()[0]
 
-            # Vagas pendentes
-            self.cursor.execute("SELECT COUNT(*) FROM urls WHERE processed = FALSE")
-            pending = self.cursor.fetchone()[0]
+                # Vagas pendentes
+                cursor.execute("SELECT COUNT(*) FROM urls WHERE processed = FALSE")
+                pending = cursor.fetchone()[0]
 
-            # Contagem por localização
-            self.cursor.execute(
-                """
-                SELECT location, COUNT(*) 
-                FROM urls 
-                GROUP BY location
-                """
-            )
-            locations = {row[0]: row[1] for row in self.cursor.fetchall()}
+                # Contagem por localização
+                cursor.execute(
+                    """
+                    SELECT location, COUNT(*) 
+                    FROM urls 
+                    GROUP BY location
+                    """
+                )
+                locations = {row[0]: row[1] for row in cursor.fetchall()}
 
-            return {
-                'total': total,
-                'pending': pending,
-                'locations': locations
-            }
+                return {
+                    'total': total,
+                    'pending': pending,
+                    'locations': locations
+                }
         except Exception as e:
             print(f"Erro ao obter status: {e}")
             return {
@@ -287,22 +628,12 @@ class SupabaseClient:
         Limpa todas as tabelas do banco de dados
         """
         try:
-            # Primeiro limpa a tabela jobs devido à chave estrangeira
-            self.cursor.execute("DELETE FROM jobs")
-            # Depois limpa a tabela urls
-            self.cursor.execute("DELETE FROM urls")
-            self.connection.commit()
-            return True
+            with self.cursor() as cursor:
+                # Primeiro limpa a tabela jobs devido à chave estrangeira
+                cursor.execute("DELETE FROM jobs")
+                # Depois limpa a tabela urls
+                cursor.execute("DELETE FROM urls")
+                return True
         except Exception as e:
             print(f"Erro ao limpar banco de dados: {e}")
-            self.connection.rollback()
             return False
-
-    def __del__(self):
-        """
-        Fecha a conexão quando o objeto é destruído
-        """
-        if hasattr(self, 'cursor') and self.cursor:
-            self.cursor.close()
-        if hasattr(self, 'connection') and self.connection:
-            self.connection.close()
@@ -1,10 +1,14 @@
 import logging
-from typing import List, Dict
+import threading
+from typing import List, Dict, Optional, Set
 from .supabase_client import SupabaseClient
+from src.utils.config import MAX_URL_ATTEMPTS
 
 class URLProcessor:
-    def __init__(self):
+    def __init__(self, max_attempts: int = MAX_URL_ATTEMPTS):
         self.db = SupabaseClient()
+        # Limite de tentativas da execução (--max-attempts); erros permanentes o esgotam
+        self.max_attempts = max_attempts
         self._setup_logging()
 
     def _setup_logging(self):
@@ -19,23 +23,119 @@ class URLProcessor:
         Salva os dados das vagas no Supabase
         """
         try:
-            self.db.insert_jobs(jobs_data)
-            self.logger.info(f"Salvos dados de {len(jobs_data)} vagas no Supabase")
+            result = self.db.insert_jobs(jobs_data)
+            if result is None:
+                self.logger.error(f"Falha ao salvar dados de {len(jobs_data)} vagas no Supabase")
+                return
+            self.logger.info(f"Salvos dados de {len(jobs_data)} vagas no Supabase: "
+                             f"{result['inserted']} novas, {result['skipped']} já existentes")
         except Exception as e:
             self.logger.error(f"Erro ao salvar dados das vagas: {str(e)}")
 
-    def get_pending_urls(self) -> List[str]:
+    def get_pending_urls(self, max_attempts: int = None) -> List[str]:
         """
         Retorna URLs que ainda não foram processadas
         """
         try:
-            pending_urls = self.db.get_pending_urls()
+            pending_urls = self.db.get_pending_urls(max_attempts)
             self.logger.info(f"Encontradas {len(pending_urls)} URLs pendentes")
             return pending_urls
         except Exception as e:
             self.logger.error(f"Erro ao buscar URLs pendentes: {str(e)}")
             return []
 
+    def claim_urls(self, worker_id: str, batch_size: int, lease_seconds: int,
+                   max_attempts: int = None, urls: List[str] = None) -> List[str]:
+        """
+        Reserva um lote de URLs pendentes para este worker (opcionalmente
+        apenas entre as `urls` informadas)
+        """
+        try:
+            claimed = self.db.claim_urls(worker_id, batch_size, lease_seconds, max_attempts, urls)
+            self.logger.info(f"{len(claimed)} URLs reservadas para {worker_id}")
+            return claimed
+        except Exception as e:
+            self.logger.error(f"Erro ao reservar URLs: {str(e)}")
+            return []
+
+    def release_urls(self, worker_id: str) -> None:
+        """
+        Devolve à fila as URLs ainda reservadas por este worker
+        """
+        try:
+            released = self.db.release_urls(worker_id)
+            if released:
+                self.logger.info(f"{released} URLs reservadas por {worker_id} devolvidas à fila")
+        except Exception as e:
+            self.logger.error(f"Erro ao liberar URLs reservadas: {str(e)}")
+
+    def start_attempt(self, url: str) -> None:
+        """
+        Conta uma tentativa para a URL no início da sua coleta
+        """
+        try:
+            self.db.start_attempt(url)
+        except Exception as e:
+            self.logger.error(f"Erro ao registrar tentativa da URL: {str(e)}")
+
+    def renew_leases(self, worker_id: str, lease_seconds: int) -> None:
+        """
+        Estende as reservas ainda abertas deste worker
+        """
+        try:
+            renewed = self.db.renew_leases(worker_id, lease_seconds)
+            self.logger.debug(f"{renewed} reservas de {worker_id} renovadas por {lease_seconds}s")
+        except Exception as e:
+            self.logger.error(f"Erro ao renovar reservas: {str(e)}")
+
+    def get_known_urls(self, since=None) -> Set[str]:
+        """
+        Retorna as URLs já armazenadas (publicadas a partir de `since`, se informado)
+        """
+        try:
+            known_urls = self.db.get_known_urls(since)
+            latest = self.db.get_latest_posted_date()
+            self.logger.info(f"{len(known_urls)} URLs já armazenadas (publicação mais recente: {latest})")
+            return known_urls
+        except Exception as e:
+            self.logger.error(f"Erro ao buscar URLs armazenadas: {str(e)}")
+            return set()
+
+    def save_checkpoint(self, base_url: str, jobs_data: List[Dict], state) -> None:
+        """
+        Salva as vagas novas de uma coleta em andamento e grava sua posição.
+        Coletas que terminaram têm o checkpoint removido.
+        """
+        try:
+            # As URLs são gravadas antes do cursor: se o processo cair entre
+            # os dois passos, a retomada apenas revê alguns cards
+            inserted = 0
+            if jobs_data:
+                result = self.db.insert_jobs(jobs_data)
+                if result is None:
+                    # Sem as URLs gravadas o cursor não pode avançar
+                    self.logger.error(f"Checkpoint de {base_url} não gravado: falha ao salvar as vagas")
+                    return
+                inserted = result['inserted']
+            if state.finished:
+                self.db.delete_checkpoint(base_url)
+                self.logger.info(f"Checkpoint: {inserted} vagas novas salvas, coleta de {base_url} concluída")
+            else:
+                self.db.save_checkpoint(base_url, state.last_posted_date, state.cursor)
+                self.logger.info(f"Checkpoint: {inserted} vagas novas salvas, {base_url} no card {state.cursor}")
+        except Exception as e:
+            self.logger.error(f"Erro ao gravar checkpoint: {str(e)}")
+
+    def get_checkpoint(self, base_url: str) -> Optional[Dict]:
+        """
+        Retorna o ponto de retomada da coleta de uma listagem, se houver
+        """
+        try:
+            return self.db.get_checkpoint(base_url)
+        except Exception as e:
+            self.logger.error(f"Erro ao buscar checkpoint: {str(e)}")
+            return None
+
     def mark_url_as_processed(self, url: str) -> None:
         """
         Marca uma URL como processada
@@ -46,6 +146,16 @@ class URLProcessor:
         except Exception as e:
             self.logger.error(f"Erro ao marcar URL como processada: {str(e)}")
 
+    def record_failure(self, url: str, error: str, permanent: bool = False) -> None:
+        """
+        Registra uma falha de processamento; erros permanentes esgotam as tentativas da URL
+        """
+        try:
+            self.db.record_failure(url, error, self.max_attempts if permanent else 0)
+            self.logger.warning(f"Falha registrada para {url}: {error}")
+        except Exception as e:
+            self.logger.error(f"Erro ao registrar falha da URL: {str(e)}")
+
     def get_processing_status(self) -> Dict:
         """
         Retorna o status atual do processamento
@@ -55,3 +165,31 @@ class URLProcessor:
         except Exception as e:
             self.logger.error(f"Erro ao obter status do processamento: {str(e)}")
             return {'total': 0, 'pending': 0, 'locations': {}}
+
+class LeaseRenewer:
+    """
+    Renova as reservas do worker a cada `lease_seconds / 3` segundos
+    enquanto o bloco `with` estiver em andamento. Lotes lentos (novas
+    tentativas, circuito aberto) não chegam a expirar e ser assumidos por
+    outro worker; se o processo morrer, as reservas expiram normalmente.
+    """
+
+    def __init__(self, url_processor: URLProcessor, worker_id: str, lease_seconds: int):
+        self.url_processor = url_processor
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.interval = max(1, lease_seconds / 3)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='reservas', daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.url_processor.renew_leases(self.worker_id, self.lease_seconds)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
@@ -0,0 +1,312 @@
+from collections import OrderedDict
+from src.utils.config import ASSET_CACHE_DIR, ASSET_CACHE_MAX_BYTES, ASSET_CACHE_SAVE_INTERVAL
+from typing import Dict, Optional
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+# Tipos de recurso estáticos que podem ser servidos do cache
+CACHEABLE_RESOURCE_TYPES = ('script', 'stylesheet', 'font', 'image')
+
+# Cabeçalhos da resposta que não devem ser repetidos ao servir do disco
+_SKIP_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie')
+
+class AssetCache:
+    """
+    Cache em disco de arquivos estáticos (JS, CSS, fontes, imagens),
+    compartilhado por todos os contextos do navegador e entre execuções.
+    Respostas ainda válidas (max-age/immutable) são servidas direto do
+    disco; as demais são revalidadas com ETag/Last-Modified. O tamanho
+    total é limitado e os itens menos usados são removidos primeiro.
+
+    O índice é gravado no disco no máximo a cada `save_interval` segundos
+    e ao final do processo (flush), não a cada arquivo novo.
+    """
+
+    def __init__(self, directory: str = ASSET_CACHE_DIR, max_bytes: int = ASSET_CACHE_MAX_BYTES,
+                 save_interval: float = ASSET_CACHE_SAVE_INTERVAL):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.save_interval = save_interval
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(directory, 'index.json')
+        self._index: "OrderedDict[str, Dict]" = OrderedDict()
+        self._dirty = False
+        self._saved_at = time.monotonic()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.bytes_served = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        for key, entry in entries:
+            if os.path.exists(self._body_path(key)):
+                self._index[key] = entry
+                self.total_bytes += entry['size']
+
+    def _save_index(self):
+        # Temporário exclusivo: outros processos podem gravar o mesmo índice
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix='index.', suffix='.tmp', dir=self.directory)
+        except OSError as e:
+            self.logger.error(f"Erro ao gravar o índice do cache de arquivos: {str(e)}")
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(list(self._index.items()), f)
+            os.replace(tmp_path, self._index_path)
+        except OSError as e:
+            self.logger.error(f"Erro ao gravar o índice do cache de arquivos: {str(e)}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def _index_changed(self):
+        """
+        Marca o índice como alterado e o grava se a última gravação já
+        passou de `save_interval` segundos. Chamado com o lock adquirido.
+        """
+        self._dirty = True
+        if time.monotonic() - self._saved_at >= self.save_interval:
+            self._save_index()
+
+    def flush(self) -> None:
+        """
+        Grava o índice se houver alterações pendentes
+        """
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.bin')
+
+    def applies_to(self, request) -> bool:
+        return request.method == 'GET' and request.resource_type in CACHEABLE_RESOURCE_TYPES
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """
+        Retorna a entrada do cache para a URL e marca como usada recentemente
+        """
+        with self._lock:
+            key = self._key(url)
+            entry = self._index.get(key)
+            if entry is not None:
+                self._index.move_to_end(key)
+            return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        return entry.get('expires_at', 0) > time.time()
+
+    def read_body(self, url: str) -> Optional[bytes]:
+        try:
+            with open(self._body_path(self._key(url)), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def conditional_headers(self, request, entry: Optional[Dict]) -> Dict:
+        """
+        Cabeçalhos da requisição acrescidos dos validadores da entrada em cache
+        """
+        headers = dict(request.headers)
+        if entry:
+            if entry.get('etag'):
+                headers['if-none-match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['if-modified-since'] = entry['last_modified']
+        return headers
+
+    def _max_age(self, headers: Dict) -> Optional[int]:
+        cache_control = headers.get('cache-control', '').lower()
+        if 'no-store' in cache_control or 'private' in cache_control:
+            return None
+        if 'immutable' in cache_control:
+            return 365 * 24 * 3600
+        match = re.search(r'max-age=(\d+)', cache_control)
+        if match:
+            return int(match.group(1))
+        return 0
+
+    def store(self, url: str, status: int, headers: Dict, body: bytes) -> None:
+        """
+        Grava uma resposta no cache, se ela puder ser reaproveitada
+        """
+        headers = {name.lower(): value for name, value in headers.items()}
+        max_age = self._max_age(headers)
+        if status != 200 or max_age is None or len(body) > self.max_bytes:
+            return
+        if max_age == 0 and not (headers.get('etag') or headers.get('last-modified')):
+            return
+
+        key = self._key(url)
+        entry = {
+            'url': url,
+            'status': status,
+            'headers': {name: value for name, value in headers.items() if name not in _SKIP_HEADERS},
+            'etag': headers.get('etag'),
+            'last_modified': headers.get('last-modified'),
+            'expires_at': time.time() + max_age,
+            'size': len(body)
+        }
+        with self._lock:
+            try:
+                with open(self._body_path(key), 'wb') as f:
+                    f.write(body)
+            except OSError as e:
+                self.logger.error(f"Erro ao gravar no cache de arquivos: {str(e)}")
+                return
+            previous = self._index.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous['size']
+            self._index[key] = entry
+            self.total_bytes += entry['size']
+            self._evict()
+            self._index_changed()
+
+    def refresh(self, url: str, headers: Dict) -> None:
+        """
+        Atualiza a validade de uma entrada após uma resposta 304
+        """
+        headers = {name.lower(): value for name, value in headers.items()}
+        max_age = self._max_age(headers) or 0
+        with self._lock:
+            entry = self._index.get(self._key(url))
+            if entry is not None:
+                entry['expires_at'] = time.time() + max_age
+                self._index_changed()
+
+    def _evict(self):
+        """
+        Remove as entradas usadas há mais tempo até respeitar o limite de tamanho
+        """
+        while self.total_bytes > self.max_bytes and self._index:
+            key, entry = self._index.popitem(last=False)
+            self.total_bytes -= entry['size']
+            try:
+                os.remove(self._body_path(key))
+            except OSError:
+                pass
+
+    def handle(self, route, request) -> None:
+        """
+        Atende uma requisição interceptada (API sync do Playwright)
+        """
+        entry = self.lookup(request.url)
+        if entry and self.is_fresh(entry):
+            body = self.read_body(request.url)
+            if body is not None:
+                self._count_hit(body)
+                route.fulfill(status=entry['status'], headers=entry['headers'], body=body)
+                return
+
+        try:
+            response = route.fetch(headers=self.conditional_headers(request, entry))
+        except Exception as e:
+            self.logger.error(f"Erro ao buscar {request.url}: {str(e)}")
+            route.abort('failed')
+            return
+        if response.status == 304 and entry:
+            body = self.read_body(request.url)
+            if body is not None:
+                self.revalidated += 1
+                self._count_hit(body)
+                self.refresh(request.url, response.headers)
+                route.fulfill(status=entry['status'], headers=entry['headers'], body=body)
+                return
+
+        self.misses += 1
+        body = response.body()
+        self.store(request.url, response.status, response.headers, body)
+        route.fulfill(response=response, body=body)
+
+    async def handle_async(self, route, request) -> None:
+        """
+        Atende uma requisição interceptada (API async do Playwright)
+        """
+        entry = self.lookup(request.url)
+        if entry and self.is_fresh(entry):
+            body = self.read_body(request.url)
+            if body is not None:
+                self._count_hit(body)
+                await route.fulfill(status=entry['status'], headers=entry['headers'], body=body)
+                return
+
+        try:
+            response = await route.fetch(headers=self.conditional_headers(request, entry))
+        except Exception as e:
+            self.logger.error(f"Erro ao buscar {request.url}: {str(e)}")
+            await route.abort('failed')
+            return
+        if response.status == 304 and entry:
+            body = self.read_body(request.url)
+            if body is not None:
+                self.revalidated += 1
+                self._count_hit(body)
+                self.refresh(request.url, response.headers)
+                await route.fulfill(status=entry['status'], headers=entry['headers'], body=body)
+                return
+
+        self.misses += 1
+        body = await response.body()
+        self.store(request.url, response.status, response.headers, body)
+        await route.fulfill(response=response, body=body)
+
+    def _count_hit(self, body: bytes):
+        with self._lock:
+            self.hits += 1
+            self.bytes_served += len(body)
+
+    def stats(self) -> Dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'revalidated': self.revalidated,
+            'bytes_served': self.bytes_served,
+            'entries': len(self._index),
+            'total_bytes': self.total_bytes
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        self.logger.info(
+            f"Cache de arquivos: {stats['hits']} hits ({stats['revalidated']} revalidados), "
+            f"{stats['misses']} misses, {stats['bytes_served'] / 1024:.0f} KB servidos do disco | "
+            f"{stats['entries']} itens, {stats['total_bytes'] / 1024 / 1024:.1f} MB"
+        )
+
+_asset_cache = None
+_asset_cache_lock = threading.Lock()
+
+def get_asset_cache() -> AssetCache:
+    """
+    Retorna o cache de arquivos compartilhado do processo
+    """
+    global _asset_cache
+    with _asset_cache_lock:
+        if _asset_cache is None:
+            _asset_cache = AssetCache()
+            atexit.register(_asset_cache.flush)
+        return _asset_cache
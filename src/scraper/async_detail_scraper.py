@@ -0,0 +1,234 @@
+from .base_scraper import BaseScraper
+from .job_scraper import JobScraper
+from .http_job_scraper import HttpJobScraper
+from .resource_policy import ResourcePolicy
+from .navigation import NavigationPolicy
+from .memory_governor import MemoryGovernor
+from src.utils.retry import RetryPolicy, ScrapeError
+from playwright.async_api import async_playwright
+from typing import Callable, Dict, List, Optional
+import asyncio
+import queue
+import time
+
+class AsyncDetailScraper(BaseScraper):
+    """
+    Coleta páginas de detalhe de forma concorrente usando a API async do
+    Playwright: um único navegador e até `concurrency` páginas abertas ao
+    mesmo tempo. O ritmo por host é controlado pelo limitador de taxa
+    compartilhado.
+    """
+
+    def __init__(self, concurrency: int = 4, pages_per_context: int = 50,
+                 resource_policy: ResourcePolicy = None, http_first: bool = False,
+                 retry_policy: RetryPolicy = None, profile: Optional[str] = None,
+                 navigation: NavigationPolicy = None, memory: MemoryGovernor = None,
+                 recycles_before_restart: int = 3):
+        super().__init__(resource_policy, profile, navigation=navigation)
+        self.memory = memory or MemoryGovernor()
+        # Reciclagens seguidas de contexto por memória antes de reiniciar o navegador
+        self.recycles_before_restart = recycles_before_restart
+        self.http_first = http_first
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.concurrency = max(1, concurrency)
+        self.pages_per_context = pages_per_context
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._context_pages = 0
+        self._context_users = {}
+        self._context_browsers = {}  # Navegador de cada contexto ainda aberto
+        self._memory_recycles = 0
+        self._context_lock = None
+
+    def scrape(self, urls: List[str], on_result: Callable[[str, Optional[Dict], Optional[Exception]], None],
+               on_start: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Ponto de entrada síncrono: processa todas as URLs e chama
+        `on_result(url, vaga, erro)` para cada uma; vaga é None e erro
+        traz a última exceção quando a coleta falhou. `on_start(url)`, se
+        informado, é chamado quando a coleta de cada URL começa.
+
+        Os callbacks rodam no loop de eventos e não devem bloquear.
+        """
+        asyncio.run(self.run(urls, on_result, on_start))
+
+    def scrape_stream(self, url_queue: queue.Queue,
+                      on_result: Callable[[str, Optional[Dict], Optional[Exception]], None],
+                      on_start: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Como scrape, mas consome as URLs de uma fila preenchida por outra
+        thread enquanto a coleta acontece. Um None na fila encerra o consumo.
+        """
+        asyncio.run(self.run_stream(url_queue, on_result, on_start=on_start))
+
+    async def run(self, urls: List[str], on_result: Callable[[str, Optional[Dict], Optional[Exception]], None],
+                  on_start: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Processa as URLs com no máximo `concurrency` páginas simultâneas
+        """
+        url_queue = queue.Queue()
+        for url in urls:
+            url_queue.put(url)
+        url_queue.put(None)
+        await self.run_stream(url_queue, on_result, total=len(urls), on_start=on_start)
+
+    async def run_stream(self, url_queue: queue.Queue,
+                         on_result: Callable[[str, Optional[Dict], Optional[Exception]], None],
+                         total: Optional[int] = None,
+                         on_start: Optional[Callable[[str], None]] = None) -> None:
+        """
+        Processa as URLs da fila com `concurrency` workers até encontrar um None
+        """
+        self._context_lock = asyncio.Lock()
+        started = time.monotonic()
+        done = 0
+
+        async with async_playwright() as p:
+            self._playwright = p
+            self._browser = await self._launch_browser(p)
+            try:
+                async def worker():
+                    nonlocal done
+                    while True:
+                        url = await self._next_url(url_queue)
+                        if url is None:
+                            # Devolve o marcador de fim para os outros workers
+                            url_queue.put(None)
+                            return
+                        if on_start is not None:
+                            on_start(url)
+                        job, error = await self._scrape_url(url)
+                        on_result(url, job, error)
+                        done += 1
+                        if done % 10 == 0:
+                            elapsed = time.monotonic() - started
+                            progress = f"{done}/{total}" if total is not None else f"{done}"
+                            self.logger.info(f"{progress} vagas processadas ({done / elapsed:.2f} vagas/s)")
+
+                await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+            finally:
+                storage_state = self._storage_state_path()
+                if storage_state and self._context is not None:
+                    try:
+                        await self._context.storage_state(path=storage_state)
+                    except Exception as e:
+                        self.logger.error(f"Erro ao salvar estado do perfil {self.profile}: {str(e)}")
+                # Inclui navegadores substituídos que ainda tinham páginas abertas
+                for browser in {self._browser, *self._context_browsers.values()}:
+                    await browser.close()
+                self._playwright = None
+                self._browser = None
+                self._context = None
+                self._context_users = {}
+                self._context_browsers = {}
+                self._memory_recycles = 0
+
+        elapsed = time.monotonic() - started
+        if elapsed > 0:
+            self.logger.info(f"Processadas {done} vagas em {elapsed:.1f}s ({done / elapsed:.2f} vagas/s)")
+        self.resource_policy.log_stats()
+        self.navigation.log_stats()
+        self.memory.log_stats()
+
+    async def _next_url(self, url_queue: queue.Queue, poll_interval: float = 0.05) -> Optional[str]:
+        """
+        Retira a próxima URL da fila sem bloquear o loop de eventos
+        """
+        while True:
+            try:
+                return url_queue.get_nowait()
+            except queue.Empty:
+                await asyncio.sleep(poll_interval)
+
+    async def _scrape_url(self, url: str):
+        """
+        Coleta uma vaga, primeiro via HTTP (se habilitado) e depois pelo
+        navegador com novas tentativas. Retorna (vaga, erro).
+        """
+        if self.http_first:
+            await self.rate_limiter.acquire_async(url)
+            job = await asyncio.to_thread(HttpJobScraper(url).fetch_jobs, None, False)
+            if job:
+                return job, None
+            self.logger.info(f"Extração via HTTP incompleta, usando navegador: {url}")
+
+        try:
+            job = await self.retry_policy.call_async(lambda: self._scrape_once(url), url)
+            return job, None
+        except Exception as e:
+            self.logger.error(f"Erro ao buscar vaga {url}: {e}")
+            return None, e
+
+    async def _scrape_once(self, url: str) -> Optional[Dict]:
+        """
+        Coleta uma vaga em uma página emprestada do contexto atual
+        """
+        context = await self._acquire_context()
+        try:
+            page = await context.new_page()
+            page.set_default_timeout(10000)  # 10 segundos
+            try:
+                scraper = JobScraper(url)
+                response = await self._goto_async(page, url, wait_for=scraper.required_selectors)
+                if response is None:
+                    raise ScrapeError("Não foi possível obter resposta da página")
+                if response.status >= 400:
+                    raise ScrapeError(f"Página retornou status {response.status}", response.status)
+                return await scraper.parse_jobs_async(page, url)
+            finally:
+                await page.close()
+        finally:
+            await self._release_context(context)
+
+    async def _acquire_context(self):
+        """
+        Retorna o contexto atual, criando um novo quando o limite de páginas
+        é atingido ou a memória dos navegadores passa do limite. Se a memória
+        continua alta após `recycles_before_restart` reciclagens seguidas, o
+        navegador é trocado por um novo; o antigo fecha quando suas últimas
+        páginas terminam.
+        """
+        async with self._context_lock:
+            over_memory = self._context_pages > 0 and self.memory.rss_exceeded()
+            if over_memory:
+                self._memory_recycles += 1
+                if self._memory_recycles > self.recycles_before_restart:
+                    self.memory.record_recycle('navegador', 'memória acima do limite mesmo após reciclar contextos')
+                    self._browser = await self._launch_browser(self._playwright)
+                    self._memory_recycles = 0
+                else:
+                    self.memory.record_recycle('contexto', 'memória dos navegadores acima do limite')
+            elif self._context_pages > 0:
+                self._memory_recycles = 0
+            if self._context is None or self._context_pages >= self.pages_per_context or over_memory:
+                previous = self._context
+                self._context = await self._browser.new_context(**self._context_options())
+                await self.resource_policy.attach(self._context)
+                self._context_pages = 0
+                self._context_users[self._context] = 0
+                self._context_browsers[self._context] = self._browser
+                if previous is not None and self._context_users[previous] == 0:
+                    await self._close_context(previous)
+            self._context_pages += 1
+            self._context_users[self._context] += 1
+            return self._context
+
+    async def _release_context(self, context):
+        """
+        Fecha contextos antigos assim que a última página deles termina
+        """
+        self._context_users[context] -= 1
+        if context is not self._context and self._context_users[context] == 0:
+            await self._close_context(context)
+
+    async def _close_context(self, context):
+        """
+        Fecha um contexto antigo e, se ele era o último de um navegador
+        substituído, fecha também esse navegador
+        """
+        del self._context_users[context]
+        browser = self._context_browsers.pop(context)
+        await context.close()
+        if browser is not self._browser and browser not in self._context_browsers.values():
+            await browser.close()
@@ -1,10 +1,31 @@
 from abc import ABC, abstractmethod
 from playwright.sync_api import sync_playwright, TimeoutError
+from .resource_policy import ResourcePolicy
+from .navigation import NavigationPolicy
+from src.utils.rate_limiter import get_rate_limiter
+from src.utils.config import BROWSER_PROFILES_DIR
+from typing import Iterable, Optional
 import logging
+import os
+import time
 
 class BaseScraper(ABC):
-    def __init__(self):
+    def __init__(self, resource_policy: ResourcePolicy = None, profile: Optional[str] = None,
+                 persistent_profile: bool = False, navigation: NavigationPolicy = None):
+        """
+        profile: nome do perfil do navegador (ex.: 'listagem', 'detalhe').
+        Com perfil, cookies e localStorage são salvos ao final e restaurados
+        na próxima execução; com persistent_profile, o diretório de dados
+        inteiro do Chromium (incluindo o cache HTTP) é mantido entre execuções.
+
+        navigation: quando uma navegação é considerada pronta (ver NavigationPolicy).
+        """
         self._setup_logging()
+        self.resource_policy = resource_policy or ResourcePolicy()
+        self.navigation = navigation or NavigationPolicy()
+        self.rate_limiter = get_rate_limiter()
+        self.profile = profile
+        self.persistent_profile = persistent_profile and profile is not None
 
     def _setup_logging(self):
         logging.basicConfig(
@@ -13,12 +34,62 @@ class BaseScraper(ABC):
         )
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    def _launch_browser(self, playwright):
+        """
+        Inicia uma instância do Chromium em modo headless
+        """
+        return playwright.chromium.launch(headless=True)
+
+    def _storage_state_path(self) -> Optional[str]:
+        if not self.profile or self.persistent_profile:
+            return None
+        return os.path.join(BROWSER_PROFILES_DIR, f"{self.profile}.json")
+
+    def _user_data_dir(self) -> str:
+        return os.path.join(BROWSER_PROFILES_DIR, self.profile)
+
+    def _save_storage_state(self, context):
+        """
+        Salva cookies e localStorage do contexto no arquivo do perfil
+        """
+        path = self._storage_state_path()
+        if not path:
+            return
+        try:
+            context.storage_state(path=path)
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar estado do perfil {self.profile}: {str(e)}")
+
     def _create_browser_context(self, playwright):
         """
         Cria um contexto do navegador com configurações padrão
         """
-        browser = playwright.chromium.launch(headless=True)
-        context = browser.new_context(
+        if self.persistent_profile:
+            context = playwright.chromium.launch_persistent_context(
+                self._user_data_dir(), headless=True, **self._context_options()
+            )
+            self.resource_policy.attach(context)
+            # Contextos persistentes não têm objeto Browser: o próprio contexto
+            # cumpre os dois papéis (fechar duas vezes não gera erro)
+            return context, context
+
+        browser = self._launch_browser(playwright)
+        context = self._new_context(browser)
+        return browser, context
+
+    def _new_context(self, browser):
+        """
+        Cria um novo contexto em um navegador já iniciado
+        """
+        context = browser.new_context(**self._context_options())
+        self.resource_policy.attach(context)
+        return context
+
+    def _context_options(self):
+        """
+        Opções padrão dos contextos (compartilhadas pelas APIs sync e async)
+        """
+        options = dict(
             bypass_csp=True,
             java_script_enabled=True,
             ignore_https_errors=True,
@@ -39,7 +110,14 @@ class BaseScraper(ABC):
                 'Upgrade-Insecure-Requests': '1'
             }
         )
-        return browser, context
+        if self.profile:
+            # Com perfil, o cache do navegador deve ser aproveitado
+            del options['extra_http_headers']['Cache-Control']
+            del options['extra_http_headers']['Pragma']
+        storage_state = self._storage_state_path()
+        if storage_state and os.path.exists(storage_state):
+            options['storage_state'] = storage_state
+        return options
 
     def _create_page(self, context):
         """
@@ -49,12 +127,71 @@ class BaseScraper(ABC):
         page.set_default_timeout(10000)  # 10 segundos
         return page
 
+    def _goto(self, page, url, wait_for: Iterable[str] = ()):
+        """
+        Navega para uma URL respeitando o limitador de taxa do host e
+        informa a ele o status e a latência da resposta.
+
+        Depois da resposta, espera os seletores `wait_for` conforme a
+        política de navegação e registra o tempo da navegação.
+        """
+        self.rate_limiter.acquire(url)
+        started = time.monotonic()
+        try:
+            response = page.goto(url, wait_until=self.navigation.wait_until, timeout=self.navigation.timeout_ms)
+        except Exception:
+            # Timeout ou erro de conexão (net::ERR_*): sem resposta do host
+            self.rate_limiter.record(url, None, time.monotonic() - started)
+            self.navigation.record(url, time.monotonic() - started, None)
+            raise
+        response_time = time.monotonic() - started
+        self.rate_limiter.record(url, response.status if response else None, response_time)
+
+        # Páginas de erro não têm os seletores esperados
+        if response is None or response.status >= 400:
+            self.navigation.record(url, response_time, None)
+            return response
+        try:
+            self.navigation.wait_ready(page, wait_for)
+        except Exception:
+            self.navigation.record(url, response_time, None)
+            raise
+        self.navigation.record(url, response_time, time.monotonic() - started)
+        return response
+
+    async def _goto_async(self, page, url, wait_for: Iterable[str] = ()):
+        """
+        Versão assíncrona de _goto
+        """
+        await self.rate_limiter.acquire_async(url)
+        started = time.monotonic()
+        try:
+            response = await page.goto(url, wait_until=self.navigation.wait_until, timeout=self.navigation.timeout_ms)
+        except Exception:
+            # Timeout ou erro de conexão (net::ERR_*): sem resposta do host
+            self.rate_limiter.record(url, None, time.monotonic() - started)
+            self.navigation.record(url, time.monotonic() - started, None)
+            raise
+        response_time = time.monotonic() - started
+        self.rate_limiter.record(url, response.status if response else None, response_time)
+
+        if response is None or response.status >= 400:
+            self.navigation.record(url, response_time, None)
+            return response
+        try:
+            await self.navigation.wait_ready_async(page, wait_for)
+        except Exception:
+            self.navigation.record(url, response_time, None)
+            raise
+        self.navigation.record(url, response_time, time.monotonic() - started)
+        return response
+
     async def _navigate_to_url(self, page, url):
         """
         Navega para uma URL com tratamento de erro
         """
         try:
-            await page.goto(url, wait_until='networkidle')
+            await self._goto_async(page, url)
             return True
         except TimeoutError:
             self.logger.error(f"Timeout ao acessar {url}")
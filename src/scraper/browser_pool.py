@@ -0,0 +1,131 @@
+from .base_scraper import BaseScraper
+from .resource_policy import ResourcePolicy
+from .memory_governor import MemoryGovernor
+from playwright.sync_api import sync_playwright
+from contextlib import contextmanager
+from typing import Optional
+
+class BrowserPool(BaseScraper):
+    """
+    Mantém um único Chromium aberto durante todo o processamento e
+    empresta páginas para os scrapers de detalhe. O contexto é recriado
+    periodicamente para evitar acúmulo de memória e estado entre vagas, e
+    antes disso se a memória dos navegadores passar do limite do `memory`.
+    Com `profile`, cookies e localStorage passam de um contexto para o
+    próximo e para a execução seguinte.
+    """
+
+    def __init__(self, pages_per_context: int = 50, resource_policy: ResourcePolicy = None,
+                 profile: Optional[str] = None, memory: MemoryGovernor = None):
+        super().__init__(resource_policy, profile)
+        self.pages_per_context = pages_per_context
+        self.memory = memory or MemoryGovernor()
+        self._recycled_for_memory = False
+        self._playwright = None
+        self.browser = None
+        self.context = None
+        self._pages_served = 0
+        self.contexts_created = 0
+
+    def __enter__(self):
+        # O navegador só é iniciado quando a primeira página é pedida
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """
+        Inicia o Playwright, o navegador e o primeiro contexto
+        """
+        if self.browser is not None:
+            return
+        self.logger.info("Iniciando navegador compartilhado")
+        self._playwright = sync_playwright().start()
+        self.browser = self._launch_browser(self._playwright)
+        self._open_context()
+
+    def _open_context(self):
+        """
+        Cria um novo contexto no navegador compartilhado
+        """
+        self.context = self._new_context(self.browser)
+        self._pages_served = 0
+        self.contexts_created += 1
+
+    def recycle(self):
+        """
+        Fecha o contexto atual e abre um novo no mesmo navegador
+        """
+        self.logger.info(f"Reciclando contexto após {self._pages_served} páginas")
+        try:
+            self._save_storage_state(self.context)
+            self.context.close()
+        except Exception as e:
+            self.logger.error(f"Erro ao fechar contexto: {str(e)}")
+        self._open_context()
+
+    def _free_memory(self):
+        """
+        Recicla o contexto; se a memória continuar acima do limite depois
+        disso, reinicia o navegador inteiro
+        """
+        if self._recycled_for_memory:
+            self.memory.record_recycle('navegador', 'memória acima do limite mesmo após reciclar o contexto')
+            self.close()
+            self.start()
+            self._recycled_for_memory = False
+        else:
+            self.memory.record_recycle('contexto', 'memória dos navegadores acima do limite')
+            self.recycle()
+            self._recycled_for_memory = True
+
+    @contextmanager
+    def page(self):
+        """
+        Empresta uma página do contexto atual; a página é fechada ao final do uso
+        """
+        if self.browser is None:
+            self.start()
+        elif not self.browser.is_connected():
+            self.logger.warning("Navegador desconectado. Reiniciando...")
+            self.close()
+            self.start()
+        elif self._pages_served >= self.pages_per_context:
+            self.recycle()
+        elif self.memory.rss_exceeded():
+            self._free_memory()
+        else:
+            self._recycled_for_memory = False
+
+        page = self._create_page(self.context)
+        try:
+            yield page
+        finally:
+            self._pages_served += 1
+            try:
+                page.close()
+            except Exception as e:
+                self.logger.error(f"Erro ao fechar página: {str(e)}")
+
+    def close(self):
+        """
+        Fecha contexto, navegador e Playwright
+        """
+        if self.browser is not None:
+            self.resource_policy.log_stats()
+            self.memory.log_stats()
+            if self.context is not None:
+                self._save_storage_state(self.context)
+        for resource in (self.context, self.browser):
+            if resource is None:
+                continue
+            try:
+                resource.close()
+            except Exception as e:
+                self.logger.error(f"Erro ao fechar navegador: {str(e)}")
+        if self._playwright is not None:
+            self._playwright.stop()
+        self._playwright = None
+        self.browser = None
+        self.context = None
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set
+import logging
+import time
+
+def job_posted_date(job_info: Dict):
+    """
+    Retorna a data de publicação de uma vaga da listagem ou None
+    """
+    if not job_info['date']:
+        return None
+    return datetime.strptime(job_info['date'].split()[0], '%Y-%m-%d').date()
+
+class CrawlState:
+    """
+    Estado de uma coleta da listagem: vagas aceitas até agora e os
+    critérios de parada (data alvo e, no modo incremental, uma sequência de
+    `known_streak_limit` vagas seguidas que já estão no banco).
+
+    Com `on_checkpoint`, as vagas novas são entregues em lotes a cada
+    `checkpoint_every` vagas ou `checkpoint_interval` segundos, junto com a
+    posição (`cursor`) e a última data de publicação vistas na listagem, para
+    que uma coleta interrompida possa ser retomada a partir de `start_cursor`.
+    """
+
+    def __init__(self, target_date, known_urls: Optional[Set[str]] = None,
+                 known_streak_limit: Optional[int] = None,
+                 on_checkpoint: Optional[Callable[[List[Dict], 'CrawlState'], None]] = None,
+                 checkpoint_every: Optional[int] = None, checkpoint_interval: Optional[float] = None,
+                 start_cursor: int = 0):
+        self.target_date = target_date
+        self.known_urls = known_urls or set()
+        self.known_streak_limit = known_streak_limit
+        self.jobs_data: List[Dict] = []
+        self.processed_urls: Set[str] = set()
+        self.known_streak = 0
+        self.known_seen = 0
+        self.stop_reason = None
+        self.cursor = start_cursor  # Cards da listagem já percorridos
+        self.last_posted_date = None
+        self.on_checkpoint = on_checkpoint
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self._flushed = 0
+        self._last_checkpoint = time.monotonic()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def finished(self) -> bool:
+        return self.stop_reason is not None
+
+    def add(self, job_info: Dict) -> bool:
+        """
+        Processa um card da listagem. Retorna True se a vaga é nova e foi
+        aceita; quando um critério de parada é atingido, define stop_reason.
+        """
+        if self.finished:
+            return False
+        self.cursor += 1
+        if job_info['url'] in self.processed_urls:
+            return False
+
+        # Verifica a data da vaga
+        job_date = job_posted_date(job_info)
+        if job_date and job_date < self.target_date:
+            self.stop_reason = f"Atingida data alvo ({job_date})"
+            self.logger.info(f"{self.stop_reason}. Finalizando coleta.")
+            return False
+
+        self.processed_urls.add(job_info['url'])
+        if job_info['date']:
+            self.last_posted_date = job_info['date']
+
+        # Vagas já armazenadas em coletas anteriores
+        if job_info['url'] in self.known_urls:
+            self.known_seen += 1
+            self.known_streak += 1
+            if self.known_streak_limit and self.known_streak >= self.known_streak_limit:
+                self.stop_reason = f"{self.known_streak} vagas seguidas já conhecidas"
+                self.logger.info(f"{self.stop_reason}. Finalizando coleta incremental.")
+            self.checkpoint()
+            return False
+
+        self.known_streak = 0
+        self.jobs_data.append(job_info)
+        self.checkpoint()
+        return True
+
+    def checkpoint(self, force: bool = False) -> None:
+        """
+        Entrega as vagas novas desde o último checkpoint, se o número de
+        vagas ou o tempo desde o último checkpoint passou do limite
+        """
+        if self.on_checkpoint is None:
+            return
+        pending = len(self.jobs_data) - self._flushed
+        due = force or (
+            (self.checkpoint_every and pending >= self.checkpoint_every)
+            or (self.checkpoint_interval and time.monotonic() - self._last_checkpoint >= self.checkpoint_interval)
+        )
+        if not due:
+            return
+        self.on_checkpoint(self.jobs_data[self._flushed:], self)
+        self._flushed = len(self.jobs_data)
+        self._last_checkpoint = time.monotonic()
@@ -0,0 +1,86 @@
+from .job_scraper import JobScraper
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional
+import requests
+import threading
+import time
+
+# Campos sem os quais a extração via HTTP é considerada incompleta
+REQUIRED_FIELDS = ('titulo', 'descricao')
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """
+    Retorna a sessão HTTP compartilhada (keep-alive com pool de conexões)
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+        return _session
+
+class HttpJobScraper(JobScraper):
+    """
+    Extrai a página de detalhe de uma vaga direto do HTML servido pelo
+    InfoJobs, sem abrir o navegador. Usa os mesmos seletores e funções de
+    limpeza de JobScraper, então o resultado tem o mesmo formato.
+    """
+
+    def __init__(self, base_url, timeout: float = 10):
+        super().__init__(base_url)
+        self.timeout = timeout
+        self.headers = self._context_options()['extra_http_headers'].copy()
+        self.headers['User-Agent'] = self._context_options()['user_agent']
+
+    def fetch_jobs(self, page=None, rate_limited: bool = True) -> Optional[Dict]:
+        """
+        Busca a vaga via HTTP. Retorna None se a requisição falhar ou se
+        algum campo obrigatório não for encontrado no HTML.
+
+        Com rate_limited=False o chamador já aguardou o limitador de taxa.
+        """
+        if rate_limited:
+            self.rate_limiter.acquire(self.base_url)
+        started = time.monotonic()
+        try:
+            response = get_session().get(self.base_url, headers=self.headers, timeout=self.timeout)
+            self.rate_limiter.record(self.base_url, response.status_code, time.monotonic() - started)
+            self.logger.info(f"Status da página: {response.status_code}")
+            if response.status_code != 200:
+                return None
+            vaga = self.parse_html(response.text, self.base_url)
+        except requests.RequestException as e:
+            # Timeout ou erro de conexão: sem resposta do host
+            self.rate_limiter.record(self.base_url, None, time.monotonic() - started)
+            self.logger.error(f"Erro de rede ao buscar vaga via HTTP: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Erro ao buscar vaga via HTTP: {e}")
+            return None
+
+        missing = [field for field in REQUIRED_FIELDS if not vaga.get(field)]
+        if missing:
+            self.logger.warning(f"Campos ausentes no HTML ({', '.join(missing)}): {self.base_url}")
+            return None
+        return vaga
+
+    def parse_html(self, html: str, url: str) -> Dict:
+        """
+        Equivalente a parse_jobs para o HTML bruto da página
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        vaga = {'url': url}
+        for field, selector in self.selectors.items():
+            try:
+                element = soup.select_one(selector)
+                if element is not None:
+                    self._add_field(vaga, field, element.get_text())
+            except Exception as e:
+                self.logger.error(f"Erro ao extrair {field}: {e}")
+        return vaga
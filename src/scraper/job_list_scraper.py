@@ -1,19 +1,91 @@
 from .base_scraper import BaseScraper
-from playwright.sync_api import sync_playwright
+from .resource_policy import ResourcePolicy
+from .navigation import NavigationPolicy
+from .memory_governor import MemoryGovernor
+from .crawl_state import CrawlState
+from src.utils.config import SITE_URL
+from playwright.sync_api import sync_playwright, TimeoutError
+from bs4 import BeautifulSoup
+import json
+import re
 import time
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Set
 from datetime import datetime
 
+# Converte um card em {href, location, date} dentro do navegador
+_CARD_TO_DICT_JS = """
+(card) => {
+    const urlElement = card.querySelector(selectors.url);
+    const locationElement = card.querySelector(selectors.location);
+    const dateElement = card.querySelector(selectors.date);
+    return {
+        href: urlElement ? urlElement.getAttribute('data-href') : null,
+        location: locationElement ? locationElement.textContent : null,
+        date: dateElement ? dateElement.getAttribute('data-value') : null
+    };
+}
+"""
+
+# Lê url, localização e data de todos os cards de uma vez, dentro do navegador
+CARD_EXTRACTION_JS = f"""
+(cards, selectors) => cards.map({_CARD_TO_DICT_JS})
+"""
+
+# Lê apenas os cards a partir da posição `start` e devolve o total de cards na página
+NEW_CARDS_EXTRACTION_JS = f"""
+({{selectors, start}}) => {{
+    const cards = document.querySelectorAll(selectors.card);
+    const result = [];
+    const toDict = {_CARD_TO_DICT_JS};
+    for (let i = start; i < cards.length; i++) {{
+        result.push(toDict(cards[i]));
+    }}
+    return {{total: cards.length, cards: result}};
+}}
+"""
+
+NEW_CARDS_ARRIVED_JS = "({selector, count}) => document.querySelectorAll(selector).length > count"
+
+# Cards mantidos ao podar o DOM no modo dom: o scroll até o último card
+# só dispara o carregamento se a página ainda for mais alta que a janela
+DOM_MODE_KEEP_CARDS = 20
+
+# Remove do DOM os cards já consumidos, mantendo os últimos como âncora do scroll
+PRUNE_CARDS_JS = """
+({selector, keep}) => {
+    const cards = document.querySelectorAll(selector);
+    const remove = Math.max(0, cards.length - keep);
+    for (let i = 0; i < remove; i++) {
+        cards[i].remove();
+    }
+    return remove;
+}
+"""
+
 class JobListScraper(BaseScraper):
-    def __init__(self, base_url: str):
-        super().__init__()
+    def __init__(self, base_url: str, resource_policy: ResourcePolicy = None, scroll_timeout_ms: int = 10000,
+                 feed_url_pattern: Optional[str] = None, profile: Optional[str] = None,
+                 persistent_profile: bool = False, navigation: NavigationPolicy = None,
+                 memory: MemoryGovernor = None, site_url: str = SITE_URL):
+        # O CSS é mantido na listagem para que o layout do scroll infinito funcione
+        super().__init__(resource_policy or ResourcePolicy(allow=['stylesheet']), profile, persistent_profile,
+                         navigation)
         self.base_url = base_url
+        self.site_url = site_url.rstrip('/')  # Prefixo dos links relativos dos cards
+        # Remove cards já lidos ou recarrega a página quando a memória passa do limite
+        self.memory = memory or MemoryGovernor()
         self.selectors = {
             'card': "div.js_rowCard",
             'url': "div.js_vacancyLoad",
             'location': "div.small.text-medium",
             'date': "div.js_date"
         }
+        self.scroll_timeout_ms = scroll_timeout_ms  # Tempo máximo de espera por novos cards após cada scroll
+        self.scroll_latencies = []  # Segundos até novos cards aparecerem, por scroll
+        # Padrão (regex) das URLs das requisições que trazem os próximos cards.
+        # Sem padrão, só é aceita uma resposta XHR/fetch cujo corpo contenha
+        # cards; respostas de analytics e outras requisições são ignoradas.
+        self.feed_url_pattern = feed_url_pattern
 
     def fetch_job_urls(self) -> List[Dict]:
         """
@@ -27,55 +99,138 @@ class JobListScraper(BaseScraper):
                 browser, context = self._create_browser_context(p)
                 page = self._create_page(context)
 
-                # Navega para a página
-                page.goto(self.base_url, wait_until='networkidle')
-
-                # Espera os cards de vagas carregarem
-                page.wait_for_selector(self.selectors['card'])
+                # Navega para a página e espera os cards de vagas carregarem
+                self._goto(page, self.base_url, wait_for=[self.selectors['card']])
 
                 # Coleta todos os cards
-                job_cards = page.query_selector_all(self.selectors['card'])
-                
-                for card in job_cards:
-                    job_info = self._extract_job_info(card)
-                    if job_info:
-                        jobs_data.append(job_info)
+                jobs_data = self._extract_all_job_info(page)
 
                 self.logger.info(f"Coletados dados de {len(jobs_data)} vagas")
 
             except Exception as e:
                 self.logger.error(f"Erro durante a coleta de dados: {str(e)}")
             finally:
+                self.resource_policy.log_stats()
+                self.navigation.log_stats()
+                self.memory.log_stats()
+                self._save_storage_state(context)
                 context.close()
                 browser.close()
 
         return jobs_data
 
-    def _extract_job_info(self, card) -> Optional[Dict]:
+    def _extract_all_job_info(self, page) -> List[Dict]:
+        """
+        Extrai os dados de todos os cards da página em uma única chamada ao navegador
+        """
+        raw_cards = page.eval_on_selector_all(self.selectors['card'], CARD_EXTRACTION_JS, self.selectors)
+        jobs_data = []
+        for raw in raw_cards:
+            job_info = self._build_job_info(raw)
+            if job_info:
+                jobs_data.append(job_info)
+        return jobs_data
+
+    def _extract_new_job_info(self, page, cursor: int, removed: int = 0):
         """
-        Extrai todas as informações relevantes de um card de vaga
+        Extrai apenas os cards adicionados depois da posição `cursor`.
+        `removed` é o número de cards do início da listagem já removidos do DOM.
+        Retorna as vagas extraídas e o novo cursor (total de cards da listagem).
         """
+        result = page.evaluate(NEW_CARDS_EXTRACTION_JS, {'selectors': self.selectors, 'start': cursor - removed})
+        jobs_data = []
+        for raw in result['cards']:
+            job_info = self._build_job_info(raw)
+            if job_info:
+                jobs_data.append(job_info)
+        return jobs_data, removed + result['total']
+
+    def _wait_for_new_cards(self, page, cards_before: int):
+        """
+        Espera até que a página tenha mais de `cards_before` cards, verificando
+        a cada frame (requestAnimationFrame) em vez de em intervalos fixos.
+        Retorna se novos cards apareceram e o tempo de espera em segundos.
+        """
+        started = time.monotonic()
         try:
-            # Extrai URL
-            url_element = card.query_selector(self.selectors['url'])
-            if not url_element:
+            page.wait_for_function(
+                NEW_CARDS_ARRIVED_JS,
+                arg={'selector': self.selectors['card'], 'count': cards_before},
+                polling='raf',
+                timeout=self.scroll_timeout_ms
+            )
+            return True, time.monotonic() - started
+        except TimeoutError:
+            return False, time.monotonic() - started
+        except Exception as e:
+            self.logger.error(f"Erro ao esperar por novos cards: {str(e)}")
+            return False, time.monotonic() - started
+
+    def _fast_scroll_to(self, page, cursor: int, max_attempts: int = 10):
+        """
+        Rola a listagem sem extrair nenhum card até a posição `cursor`, para
+        retomar uma coleta interrompida ou recarregada. Cards já passados são
+        removidos do DOM quando ele fica grande demais.
+        Retorna a posição alcançada (menor que `cursor` se a listagem acabou
+        antes) e quantos cards foram removidos do DOM.
+        """
+        self.logger.info(f"Rolando até o card {cursor}...")
+        removed = 0
+        total = page.locator(self.selectors['card']).count()
+        attempts = 0
+        while removed + total < cursor and attempts < max_attempts:
+            if self.memory.dom_exceeded(page):
+                removed += page.evaluate(PRUNE_CARDS_JS, {'selector': self.selectors['card'],
+                                                          'keep': DOM_MODE_KEEP_CARDS})
+                total = page.locator(self.selectors['card']).count()
+            page.locator(self.selectors['card']).last.scroll_into_view_if_needed()
+            found_new_cards, _ = self._wait_for_new_cards(page, total)
+            total = page.locator(self.selectors['card']).count()
+            attempts = 0 if found_new_cards else attempts + 1
+        if removed + total < cursor:
+            self.logger.warning(f"Listagem tem apenas {removed + total} cards; continuando a partir dele")
+        return min(removed + total, cursor), removed
+
+    def _reload_listing(self, page, context):
+        """
+        Fecha a página da listagem e abre uma nova na URL base, liberando a
+        memória acumulada pelo scroll
+        """
+        page.close()
+        page = self._create_page(context)
+        self._goto(page, self.base_url, wait_for=[self.selectors['card']])
+        return page
+
+    def _log_scroll_latencies(self):
+        """
+        Mostra um resumo do tempo de espera por novos cards em cada scroll
+        """
+        if not self.scroll_latencies:
+            return
+        latencies = sorted(self.scroll_latencies)
+        median = latencies[len(latencies) // 2]
+        self.logger.info(
+            f"Latência por scroll: {len(latencies)} scrolls | mediana {median:.2f}s | "
+            f"máx {latencies[-1]:.2f}s | total {sum(latencies):.1f}s"
+        )
+
+    def _build_job_info(self, raw: Dict) -> Optional[Dict]:
+        """
+        Aplica as regras de limpeza e formatação aos dados brutos de um card
+        """
+        try:
+            if not raw.get('href'):
                 return None
-            url = url_element.get_attribute('data-href')
-            # Adiciona o prefixo da URL base do InfoJobs
-            url = f"https://www.infojobs.com.br{url}"
+            # Adiciona o prefixo da URL do site
+            url = f"{self.site_url}{raw['href']}"
             
-            # Extrai localização
-            location_element = card.query_selector(self.selectors['location'])
-            location = location_element.text_content().strip() if location_element else "Não especificado"
+            location = raw['location'].strip() if raw.get('location') is not None else "Não especificado"
             # Limpa a localização removendo a parte ", X Km de você"
             if ',' in location:
                 location = location.split(',')[0].strip()
             
-            # Extrai data
-            date_element = card.query_selector(self.selectors['date'])
-            date_str = date_element.get_attribute('data-value') if date_element else None
-            
             # Formata a data
+            date_str = raw.get('date')
             if date_str:
                 try:
                     date_obj = datetime.strptime(date_str, '%Y/%m/%d %H:%M:%S')
@@ -96,95 +251,304 @@ class JobListScraper(BaseScraper):
             self.logger.error(f"Erro ao extrair informações do card: {str(e)}")
             return None
 
-    def fetch_jobs_until_date(self, target_date) -> List[Dict]:
+    def _parse_cards_html(self, html: str) -> List[Dict]:
+        """
+        Extrai os dados brutos dos cards de um trecho de HTML
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        raw_cards = []
+        for card in soup.select(self.selectors['card']):
+            url_element = card.select_one(self.selectors['url'])
+            location_element = card.select_one(self.selectors['location'])
+            date_element = card.select_one(self.selectors['date'])
+            raw_cards.append({
+                'href': url_element.get('data-href') if url_element else None,
+                'location': location_element.get_text() if location_element else None,
+                'date': date_element.get('data-value') if date_element else None
+            })
+        return raw_cards
+
+    def _parse_feed_body(self, body: str) -> List[Dict]:
+        """
+        Extrai as vagas do corpo de uma resposta do feed (HTML ou JSON com HTML)
+        """
+        card_class = self.selectors['card'].split('.')[-1]
+        if card_class not in body:
+            return []
+        html = body
+        try:
+            payload = json.loads(body)
+            html = ''.join(self._json_strings(payload))
+        except ValueError:
+            pass
+        jobs_data = []
+        for raw in self._parse_cards_html(html):
+            job_info = self._build_job_info(raw)
+            if job_info:
+                jobs_data.append(job_info)
+        return jobs_data
+
+    def _json_strings(self, value):
+        """
+        Percorre um JSON e devolve todos os textos encontrados
+        """
+        if isinstance(value, str):
+            yield value
+        elif isinstance(value, dict):
+            for item in value.values():
+                yield from self._json_strings(item)
+        elif isinstance(value, list):
+            for item in value:
+                yield from self._json_strings(item)
+
+    def _is_feed_response(self, response) -> bool:
+        """
+        Verifica se uma resposta é candidata a conter o próximo lote de cards
+        """
+        if response.request.resource_type not in ('xhr', 'fetch'):
+            return False
+        if self.feed_url_pattern:
+            return re.search(self.feed_url_pattern, response.url) is not None
+        return True
+
+    def _wait_for_feed_batch(self, page, scroll: Callable[[], None]) -> List[Dict]:
+        """
+        Executa `scroll` e espera a resposta do feed com o próximo lote.
+
+        Com feed_url_pattern, a primeira resposta que casa com o padrão é o
+        lote (vazio no fim da listagem). Sem padrão, as respostas XHR/fetch
+        são lidas na ordem em que chegam e a primeira com cards é aceita.
+        Retorna [] se nada chegar em scroll_timeout_ms.
+        """
+        candidates = []
+
+        # O Playwright guarda atributos no handler: precisa ser uma função
+        # Python, não um método embutido como candidates.append
+        def on_response(response):
+            candidates.append(response)
+
+        page.on('response', on_response)
+        try:
+            scroll()
+            deadline = time.monotonic() + self.scroll_timeout_ms / 1000
+            while time.monotonic() < deadline:
+                # Processa os eventos do navegador enquanto espera
+                page.wait_for_timeout(50)
+                while candidates:
+                    response = candidates.pop(0)
+                    if not self._is_feed_response(response):
+                        continue
+                    try:
+                        batch = self._parse_feed_body(response.text())
+                    except Exception as e:
+                        self.logger.debug(f"Resposta ignorada ({response.url}): {str(e)}")
+                        continue
+                    if batch or self.feed_url_pattern:
+                        return batch
+            return []
+        finally:
+            page.remove_listener('response', on_response)
+
+    def fetch_jobs_until_date(self, target_date, known_urls: Optional[Set[str]] = None,
+                              known_streak: Optional[int] = None,
+                              on_checkpoint: Optional[Callable] = None, checkpoint_every: Optional[int] = None,
+                              checkpoint_interval: Optional[float] = None, resume_cursor: int = 0) -> List[Dict]:
         """
         Coleta vagas até atingir uma data específica usando scroll infinito
+
+        No modo incremental (known_urls e known_streak), a coleta também para
+        ao encontrar known_streak vagas seguidas que já estão armazenadas.
+
+        on_checkpoint(vagas, state) recebe periodicamente as vagas novas (ver
+        CrawlState); com resume_cursor, os primeiros cards da listagem são
+        pulados sem extração, retomando uma coleta interrompida.
         """
         self.logger.info(f"Iniciando coleta de vagas até {target_date.strftime('%d/%m/%Y')}")
-        jobs_data = []
-        processed_urls = set()  # Conjunto para rastrear URLs já processadas
+        state = CrawlState(target_date, known_urls, known_streak, on_checkpoint,
+                           checkpoint_every, checkpoint_interval)
+        cursor = 0  # Quantidade de cards da listagem já extraídos
+        removed = 0  # Cards do início da listagem já removidos do DOM
         scroll_attempts = 0
         max_scroll_attempts = 10  # Número máximo de tentativas de scroll sem novos resultados
-        reached_target_date = False
+        last_reload = 0  # Posição da última recarga da página por memória
+        min_cards_between_reloads = 200  # Evita recarregar sem avançar na listagem
 
         with sync_playwright() as p:
             try:
                 browser, context = self._create_browser_context(p)
                 page = self._create_page(context)
 
-                # Navega para a página
+                # Navega para a página e espera os cards iniciais carregarem
                 self.logger.info("Navegando para a página inicial...")
-                page.goto(self.base_url, wait_until='networkidle')
+                self._goto(page, self.base_url, wait_for=[self.selectors['card']])
 
-                # Espera os cards de vagas carregarem inicialmente
-                self.logger.info("Aguardando cards iniciais carregarem...")
-                page.wait_for_selector(self.selectors['card'])
+                if resume_cursor:
+                    self.logger.info("Retomando coleta interrompida")
+                    cursor, removed = self._fast_scroll_to(page, resume_cursor, max_scroll_attempts)
+                    state.cursor = cursor
 
-                while not reached_target_date and scroll_attempts < max_scroll_attempts:
-                    # Coleta os cards visíveis atualmente
-                    job_cards = page.query_selector_all(self.selectors['card'])
-                    self.logger.info(f"Encontrados {len(job_cards)} cards na página")
+                while not state.finished and scroll_attempts < max_scroll_attempts:
+                    # Coleta apenas os cards que apareceram desde a última passada
+                    job_cards, cursor = self._extract_new_job_info(page, cursor, removed)
+                    self.logger.info(f"Encontrados {len(job_cards)} novos cards ({cursor} na listagem)")
                     
                     # Processa cada card
-                    for card in job_cards:
-                        job_info = self._extract_job_info(card)
-                        if job_info and job_info['url'] not in processed_urls:
-                            # Verifica a data da vaga
-                            if job_info['date']:
-                                job_date = datetime.strptime(job_info['date'].split()[0], '%Y-%m-%d').date()
-                                if job_date < target_date:
-                                    self.logger.info(f"Atingida data alvo ({job_date}). Finalizando coleta.")
-                                    reached_target_date = True
-                                    break
-                            
-                            jobs_data.append(job_info)
-                            processed_urls.add(job_info['url'])
-                            self.logger.info(f"Coletada vaga {len(jobs_data)}: {job_info['url']}")
-
-                    if reached_target_date:
+                    for job_info in job_cards:
+                        if state.add(job_info):
+                            self.logger.info(f"Coletada vaga {len(state.jobs_data)}: {job_info['url']}")
+                        if state.finished:
+                            break
+
+                    if state.finished:
                         break
 
+                    # Todos os cards da página já foram lidos: se a memória passou
+                    # do limite, remove-os do DOM ou recarrega a página na posição atual
+                    if cursor - last_reload >= min_cards_between_reloads and self.memory.rss_exceeded():
+                        self.memory.record_recycle('página', f"memória acima do limite no card {cursor}")
+                        page = self._reload_listing(page, context)
+                        cursor, removed = self._fast_scroll_to(page, cursor, max_scroll_attempts)
+                        last_reload = cursor
+                        continue
+                    if self.memory.dom_exceeded(page):
+                        self.memory.record_recycle('cards do DOM', f"DOM acima de {self.memory.max_dom_nodes} nós")
+                        removed += page.evaluate(PRUNE_CARDS_JS, {'selector': self.selectors['card'],
+                                                                  'keep': DOM_MODE_KEEP_CARDS})
+
                     # Scroll até o último card visível
-                    last_card = job_cards[-1]
                     self.logger.info("Fazendo scroll até o último card...")
-                    last_card.scroll_into_view_if_needed()
+                    page.locator(self.selectors['card']).last.scroll_into_view_if_needed()
                     
-                    # Espera um pouco para o conteúdo carregar
-                    page.wait_for_timeout(2000)  # 2 segundos
-                    
-                    # Espera novos cards aparecerem
-                    try:
-                        # Conta cards antes do scroll
-                        cards_before = len(page.query_selector_all(self.selectors['card']))
-                        self.logger.info(f"Cards antes do scroll: {cards_before}")
-                        
-                        # Espera por 10 segundos por novos cards
-                        for attempt in range(10):
-                            page.wait_for_timeout(1000)
-                            cards_after = len(page.query_selector_all(self.selectors['card']))
-                            self.logger.info(f"Cards após {attempt+1}s: {cards_after}")
-                            if cards_after > cards_before:
-                                scroll_attempts = 0  # Reset contador se encontrou novos cards
-                                break
-                        
+                    # Espera novos cards aparecerem (ou o limite de tempo)
+                    cards_before = cursor - removed
+                    found_new_cards, latency = self._wait_for_new_cards(page, cards_before)
+                    self.scroll_latencies.append(latency)
+                    if found_new_cards:
+                        scroll_attempts = 0  # Reset contador se encontrou novos cards
+                        self.logger.info(f"Novos cards após {latency:.2f}s")
+                    else:
                         # Se não apareceram novos cards, incrementa contador de tentativas
-                        if cards_after <= cards_before:
-                            scroll_attempts += 1
-                            self.logger.warning(f"Nenhum novo card encontrado. Tentativa {scroll_attempts}/{max_scroll_attempts}")
-                            
-                    except Exception as e:
-                        self.logger.error(f"Erro ao esperar por novos cards: {str(e)}")
                         scroll_attempts += 1
+                        self.logger.warning(f"Nenhum novo card encontrado. Tentativa {scroll_attempts}/{max_scroll_attempts}")
 
                 if scroll_attempts >= max_scroll_attempts:
                     self.logger.warning(f"Número máximo de tentativas de scroll atingido. Parando coleta.")
+                    state.stop_reason = "Fim da listagem"
                 
-                self.logger.info(f"Coleta finalizada. Total de vagas coletadas: {len(jobs_data)}")
+                self.logger.info(f"Coleta finalizada. Total de vagas coletadas: {len(state.jobs_data)}")
+                if state.known_seen:
+                    self.logger.info(f"Vagas já conhecidas ignoradas: {state.known_seen}")
+                self._log_scroll_latencies()
 
             except Exception as e:
                 self.logger.error(f"Erro durante a coleta de dados: {str(e)}")
             finally:
+                # Grava o que ainda não passou por um checkpoint, mesmo após um erro
+                state.checkpoint(force=True)
+                self.resource_policy.log_stats()
+                self.navigation.log_stats()
+                self.memory.log_stats()
+                self._save_storage_state(context)
                 context.close()
                 browser.close()
 
-        return jobs_data
+        return state.jobs_data
+
+    def fetch_jobs_from_feed(self, target_date, prune_dom: bool = True, known_urls: Optional[Set[str]] = None,
+                             known_streak: Optional[int] = None,
+                             on_checkpoint: Optional[Callable] = None, checkpoint_every: Optional[int] = None,
+                             checkpoint_interval: Optional[float] = None, resume_cursor: int = 0) -> List[Dict]:
+        """
+        Coleta vagas até atingir uma data específica lendo as respostas das
+        requisições do scroll infinito em vez do DOM. A página só é rolada
+        para disparar a próxima requisição; com prune_dom, os cards já
+        consumidos são removidos para que o DOM não cresça durante a coleta.
+
+        Checkpoints e resume_cursor funcionam como em fetch_jobs_until_date;
+        aqui os lotes anteriores ao cursor são descartados sem processamento.
+        """
+        self.logger.info(f"Iniciando coleta via feed até {target_date.strftime('%d/%m/%Y')}")
+        state = CrawlState(target_date, known_urls, known_streak, on_checkpoint,
+                           checkpoint_every, checkpoint_interval, resume_cursor)
+        skip = resume_cursor  # Cards já percorridos em uma execução anterior
+        scroll_attempts = 0
+        max_scroll_attempts = 10
+        last_reload = resume_cursor  # Posição da última recarga da página por memória
+        min_cards_between_reloads = 200
+
+        with sync_playwright() as p:
+            try:
+                browser, context = self._create_browser_context(p)
+                page = self._create_page(context)
+
+                self.logger.info("Navegando para a página inicial...")
+                self._goto(page, self.base_url, wait_for=[self.selectors['card']])
+
+                # O primeiro lote vem renderizado no HTML da página
+                batch, _ = self._extract_new_job_info(page, 0)
+
+                while not state.finished and scroll_attempts < max_scroll_attempts:
+                    if skip:
+                        skipped = min(skip, len(batch))
+                        batch = batch[skipped:]
+                        skip -= skipped
+                    new_cards = 0
+                    for job_info in batch:
+                        if state.add(job_info):
+                            new_cards += 1
+                        if state.finished:
+                            break
+                    self.logger.info(f"Lote com {len(batch)} cards, {new_cards} novos (total {len(state.jobs_data)})")
+
+                    if state.finished:
+                        break
+
+                    # Recarrega a página se a memória passou do limite; os lotes
+                    # até a posição atual são descartados na próxima passada
+                    if state.cursor - last_reload >= min_cards_between_reloads and self.memory.rss_exceeded():
+                        self.memory.record_recycle('página', f"memória acima do limite no card {state.cursor}")
+                        page = self._reload_listing(page, context)
+                        batch, _ = self._extract_new_job_info(page, 0)
+                        skip = last_reload = state.cursor
+                        continue
+
+                    if prune_dom:
+                        page.evaluate(PRUNE_CARDS_JS, {'selector': self.selectors['card'], 'keep': 3})
+
+                    # Rola até o último card e espera a resposta do feed
+                    started = time.monotonic()
+                    def scroll():
+                        page.locator(self.selectors['card']).last.scroll_into_view_if_needed()
+                        page.mouse.wheel(0, 1000)
+
+                    batch = self._wait_for_feed_batch(page, scroll)
+                    self.scroll_latencies.append(time.monotonic() - started)
+
+                    if batch:
+                        scroll_attempts = 0
+                    else:
+                        scroll_attempts += 1
+                        self.logger.warning(f"Nenhum card recebido do feed. Tentativa {scroll_attempts}/{max_scroll_attempts}")
+
+                if scroll_attempts >= max_scroll_attempts:
+                    self.logger.warning("Número máximo de tentativas de scroll atingido. Parando coleta.")
+                    state.stop_reason = "Fim da listagem"
+
+                self.logger.info(f"Coleta finalizada. Total de vagas coletadas: {len(state.jobs_data)}")
+                if state.known_seen:
+                    self.logger.info(f"Vagas já conhecidas ignoradas: {state.known_seen}")
+                self._log_scroll_latencies()
+
+            except Exception as e:
+                self.logger.error(f"Erro durante a coleta de dados: {str(e)}")
+            finally:
+                # Grava o que ainda não passou por um checkpoint, mesmo após um erro
+                state.checkpoint(force=True)
+                self.resource_policy.log_stats()
+                self.navigation.log_stats()
+                self.memory.log_stats()
+                self._save_storage_state(context)
+                context.close()
+                browser.close()
+
+        return state.jobs_data
@@ -1,81 +1,88 @@
+from .base_scraper import BaseScraper
+from .resource_policy import ResourcePolicy
+from .navigation import NavigationPolicy
+from src.utils.retry import ScrapeError
 from playwright.sync_api import sync_playwright, TimeoutError
-import logging
 from datetime import datetime
+from typing import Optional
 
-class JobScraper:
-    def __init__(self, base_url):
+class JobScraper(BaseScraper):
+    def __init__(self, base_url, resource_policy: ResourcePolicy = None, profile: Optional[str] = None,
+                 persistent_profile: bool = False, navigation: NavigationPolicy = None):
+        super().__init__(resource_policy, profile, persistent_profile, navigation)
         self.base_url = base_url
-        self.setup_logging()
+        self.selectors = {
+            'titulo': 'h2.js_vacancyHeaderTitle',
+            'empresa': 'div.h4 > a[target="_blank"]',
+            'local': '.js_applyVacancyHidden .text-medium.mb-4:nth-of-type(1)',
+            'salario': '.js_applyVacancyHidden .text-medium.mb-4:nth-of-type(2)',
+            'descricao': '.js_vacancyDataPanels p.mb-16.text-break'
+        }
+        self.cleaners = {
+            'titulo': self.clean_text,
+            'empresa': self.clean_text,
+            'local': self.clean_location,
+            'salario': self.clean_salary,
+            'descricao': self.clean_text
+        }
+        # Seletores que precisam estar presentes antes da extração (e antes de
+        # uma parada antecipada); empresa, local e salário são opcionais
+        self.required_selectors = [self.selectors['titulo'], self.selectors['descricao']]
     
-    def setup_logging(self):
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        self.logger = logging.getLogger(__name__)
-    
-    def fetch_jobs(self):
+    def fetch_jobs(self, page=None):
         """
         Método principal para buscar vagas usando Playwright
+
+        Se uma página for informada (por exemplo, emprestada de um BrowserPool),
+        ela é reutilizada e nenhum navegador novo é iniciado.
+        """
+        try:
+            return self.scrape(page)
+        except Exception as e:
+            self.logger.error(f"Erro ao buscar vagas: {e}")
+            return None
+
+    def scrape(self, page=None):
+        """
+        Igual a fetch_jobs, mas relança os erros para que possam ser
+        classificados e repetidos pelo chamador
         """
+        if page is not None:
+            return self._scrape_page(page)
+
         with sync_playwright() as p:
+            browser, context = self._create_browser_context(p)
             try:
-                browser = p.chromium.launch(headless=True)
-                # Criando contexto com configurações adequadas
-                context = browser.new_context(
-                    bypass_csp=True,
-                    java_script_enabled=True,
-                    ignore_https_errors=True,
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080},
-                    extra_http_headers={
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                        'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-                        'Cache-Control': 'no-cache',
-                        'Pragma': 'no-cache',
-                        'Sec-Ch-Ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-                        'Sec-Ch-Ua-Mobile': '?0',
-                        'Sec-Ch-Ua-Platform': '"Windows"',
-                        'Sec-Fetch-Dest': 'document',
-                        'Sec-Fetch-Mode': 'navigate',
-                        'Sec-Fetch-Site': 'none',
-                        'Sec-Fetch-User': '?1',
-                        'Upgrade-Insecure-Requests': '1'
-                    }
-                )
-                page = context.new_page()
-                
-                # Define um timeout menor para todas as operações
-                page.set_default_timeout(10000)  # 10 segundos
+                page = self._create_page(context)
                 
-                # Limpa cookies e cache antes de navegar
-                context.clear_cookies()
+                # Sem perfil, limpa cookies e cache antes de navegar
+                if not self.profile:
+                    context.clear_cookies()
                 
-                self.logger.info(f"Navegando para: {self.base_url}")
-                
-                # Navega para a página e aguarda carregar
-                response = page.goto(self.base_url, wait_until='networkidle')
-                
-                if response is None:
-                    self.logger.error("Não foi possível obter resposta da página")
-                    return None
-                
-                self.logger.info(f"Status da página: {response.status}")
-                
-                # Aguarda elementos importantes carregarem
-                page.wait_for_selector('h2.js_vacancyHeaderTitle', timeout=10000)
-                page.wait_for_selector('.js_vacancyDataPanels', timeout=10000)
-                
-                # Processa a página e retorna os dados
-                job_data = self.parse_jobs(page, self.base_url)
-                return job_data
-                
-            except Exception as e:
-                self.logger.error(f"Erro ao buscar vagas: {e}")
-                return None
+                job = self._scrape_page(page)
+                self._save_storage_state(context)
+                return job
             finally:
-                if 'browser' in locals():
-                    browser.close()
+                browser.close()
+
+    def _scrape_page(self, page):
+        """
+        Navega até a vaga na página informada e extrai os dados
+        """
+        self.logger.info(f"Navegando para: {self.base_url}")
+        
+        # Navega para a página e aguarda os elementos importantes carregarem
+        response = self._goto(page, self.base_url, wait_for=self.required_selectors)
+        
+        if response is None:
+            raise ScrapeError("Não foi possível obter resposta da página")
+        
+        self.logger.info(f"Status da página: {response.status}")
+        if response.status >= 400:
+            raise ScrapeError(f"Página retornou status {response.status}", response.status)
+        
+        # Processa a página e retorna os dados
+        return self.parse_jobs(page, self.base_url)
 
     def clean_text(self, text):
         """
@@ -116,53 +123,48 @@ class JobScraper:
         try:
             vaga = {'url': url}  # Adiciona a URL como primeiro campo
             
-            # Título da vaga
-            try:
-                titulo = page.locator('h2.js_vacancyHeaderTitle').first.text_content(timeout=5000).strip()
-                if titulo:
-                    self.logger.info(f"Título encontrado: {titulo}")
-                    vaga['titulo'] = self.clean_text(titulo)
-            except Exception as e:
-                self.logger.error(f"Erro ao extrair título: {e}")
-            
-            # Empresa
-            try:
-                empresa = page.locator('div.h4 > a[target="_blank"]').first.text_content(timeout=5000).strip()
-                if empresa:
-                    self.logger.info(f"Empresa encontrada: {empresa}")
-                    vaga['empresa'] = self.clean_text(empresa)
-            except Exception as e:
-                self.logger.error(f"Erro ao extrair empresa: {e}")
-            
-            # Localidade
-            try:
-                local = page.locator('.js_applyVacancyHidden .text-medium.mb-4:nth-of-type(1)').first.text_content(timeout=5000).strip()
-                if local:
-                    self.logger.info(f"Local encontrado: {local}")
-                    vaga['local'] = self.clean_location(local)
-            except Exception as e:
-                self.logger.error(f"Erro ao extrair localidade: {e}")
+            for field, selector in self.selectors.items():
+                try:
+                    raw = page.locator(selector).first.text_content(timeout=5000)
+                    self._add_field(vaga, field, raw)
+                except Exception as e:
+                    self.logger.error(f"Erro ao extrair {field}: {e}")
             
-            # Faixa Salarial
-            try:
-                salario = page.locator('.js_applyVacancyHidden .text-medium.mb-4:nth-of-type(2)').first.text_content(timeout=5000).strip()
-                if salario:
-                    self.logger.info(f"Salário encontrado: {salario}")
-                    vaga['salario'] = self.clean_salary(salario)
-            except Exception as e:
-                self.logger.error(f"Erro ao extrair salário: {e}")
+            return vaga if vaga else None
+
+        except Exception as e:
+            self.logger.error(f"Erro ao processar vaga: {e}")
+            return None
+
+    async def parse_jobs_async(self, page, url):
+        """
+        Versão assíncrona de parse_jobs para páginas da API async do Playwright
+        """
+        try:
+            vaga = {'url': url}
             
-            # Descrição da Vaga
-            try:
-                descricao = page.locator('.js_vacancyDataPanels p.mb-16.text-break').first.text_content(timeout=5000).strip()
-                if descricao:
-                    self.logger.info(f"Descrição encontrada: {len(descricao)} caracteres")
-                    vaga['descricao'] = self.clean_text(descricao)
-            except Exception as e:
-                self.logger.error(f"Erro ao extrair descrição: {e}")
+            for field, selector in self.selectors.items():
+                try:
+                    raw = await page.locator(selector).first.text_content(timeout=5000)
+                    self._add_field(vaga, field, raw)
+                except Exception as e:
+                    self.logger.error(f"Erro ao extrair {field}: {e}")
             
             return vaga if vaga else None
 
         except Exception as e:
             self.logger.error(f"Erro ao processar vaga: {e}")
             return None
+
+    def _add_field(self, vaga, field, raw):
+        """
+        Limpa o texto extraído de um campo e adiciona à vaga se não estiver vazio
+        """
+        value = raw.strip() if raw else ""
+        if not value:
+            return
+        if field == 'descricao':
+            self.logger.info(f"Campo {field} encontrado: {len(value)} caracteres")
+        else:
+            self.logger.info(f"Campo {field} encontrado: {value}")
+        vaga[field] = self.cleaners[field](value)
@@ -0,0 +1,102 @@
+from src.utils.config import MAX_BROWSER_RSS_MB, MAX_DOM_NODES
+from typing import Dict, Optional
+import logging
+import os
+import threading
+import time
+
+try:
+    import psutil
+except ImportError:  # Instalações sem o psutil do requirements.txt controlam só os nós do DOM
+    psutil = None
+
+DOM_NODE_COUNT_JS = "() => document.getElementsByTagName('*').length"
+
+class MemoryGovernor:
+    """
+    Acompanha a memória dos navegadores e indica quando páginas ou
+    contextos devem ser reciclados. Mede dois sinais:
+
+    - RSS somado dos processos filhos deste processo (driver do Playwright
+      e Chromium), se o psutil estiver instalado. A medição é feita no
+      máximo a cada `rss_interval` segundos.
+    - Número de nós do DOM de uma página, para scrolls longos.
+    """
+
+    def __init__(self, max_rss_mb: Optional[float] = MAX_BROWSER_RSS_MB,
+                 max_dom_nodes: Optional[int] = MAX_DOM_NODES, rss_interval: float = 5):
+        self.max_rss_bytes = max_rss_mb * 1024 * 1024 if max_rss_mb else None
+        self.max_dom_nodes = max_dom_nodes
+        self.rss_interval = rss_interval
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._last_rss = None
+        self._last_rss_at = 0.0
+        self.peak_rss = 0
+        self.recycles: Dict[str, int] = {}
+        if self.max_rss_bytes and psutil is None:
+            self.logger.warning("psutil não instalado: o limite de memória do navegador não será verificado")
+
+    def browser_rss(self, fresh: bool = False) -> Optional[int]:
+        """
+        RSS em bytes dos processos filhos (None sem psutil)
+        """
+        if psutil is None:
+            return None
+        with self._lock:
+            if not fresh and self._last_rss is not None and time.monotonic() - self._last_rss_at < self.rss_interval:
+                return self._last_rss
+            total = 0
+            try:
+                children = psutil.Process(os.getpid()).children(recursive=True)
+            except psutil.Error:
+                children = []
+            for child in children:
+                try:
+                    total += child.memory_info().rss
+                except psutil.Error:
+                    # O processo pode ter terminado durante a medição
+                    pass
+            self._last_rss = total
+            self._last_rss_at = time.monotonic()
+            self.peak_rss = max(self.peak_rss, total)
+            return total
+
+    def rss_exceeded(self) -> bool:
+        if not self.max_rss_bytes:
+            return False
+        rss = self.browser_rss()
+        return rss is not None and rss > self.max_rss_bytes
+
+    def dom_exceeded(self, page) -> bool:
+        """
+        Verifica o número de nós do DOM de uma página (API sync do Playwright)
+        """
+        if not self.max_dom_nodes:
+            return False
+        return page.evaluate(DOM_NODE_COUNT_JS) > self.max_dom_nodes
+
+    def record_recycle(self, action: str, reason: str) -> None:
+        """
+        Registra uma reciclagem (ex.: 'contexto', 'página') e o motivo
+        """
+        with self._lock:
+            self.recycles[action] = self.recycles.get(action, 0) + 1
+            # Após reciclar, a próxima verificação deve medir de novo
+            self._last_rss = None
+        self.logger.info(f"Reciclando {action}: {reason}")
+
+    def stats(self) -> Dict:
+        return {
+            'peak_rss': self.peak_rss,
+            'recycles': dict(self.recycles)
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        if psutil is None and not stats['recycles']:
+            return
+        self.logger.info(
+            f"Memória do navegador: pico de RSS {stats['peak_rss'] / 1024 / 1024:.0f} MB | "
+            f"reciclagens {stats['recycles']}"
+        )
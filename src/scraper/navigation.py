@@ -0,0 +1,112 @@
+from typing import Dict, Iterable, List, Optional
+import logging
+import threading
+
+# Eventos aceitos por page.goto, do mais cedo para o mais tarde
+WAIT_UNTIL_CHOICES = ('commit', 'domcontentloaded', 'load', 'networkidle')
+
+# Com parada antecipada, além dos seletores o documento precisa ter sido
+# lido até o fim (readyState deixa de ser 'loading' no DOMContentLoaded):
+# antes disso window.stop() cortaria o HTML e campos como descrição, local
+# ou salário ficariam de fora mesmo existindo na página
+EARLY_STOP_READY_JS = (
+    "(selectors) => document.readyState !== 'loading'"
+    " && selectors.every((selector) => document.querySelector(selector) !== null)"
+)
+
+class NavigationPolicy:
+    """
+    Define quando uma navegação é considerada pronta: o evento do
+    page.goto (`wait_until`) seguido dos seletores exigidos por cada
+    scraper. Com `early_stop`, o carregamento da página é interrompido
+    (window.stop) assim que todos os seletores estão presentes e o HTML
+    foi lido por completo, o que evita esperar por imagens, requisições de
+    analytics e long-polling.
+
+    Mantém o tempo de cada navegação para comparar estratégias.
+    """
+
+    def __init__(self, wait_until: str = 'domcontentloaded', early_stop: bool = False,
+                 timeout_ms: int = 10000):
+        if wait_until not in WAIT_UNTIL_CHOICES:
+            raise ValueError(f"wait_until inválido: {wait_until}")
+        self.wait_until = wait_until
+        self.early_stop = early_stop
+        self.timeout_ms = timeout_ms
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self.timings: List[Dict] = []
+
+    def wait_ready(self, page, selectors: Iterable[str]) -> None:
+        """
+        Espera os seletores na página (API sync do Playwright)
+        """
+        selectors = list(selectors)
+        if not selectors:
+            return
+        if self.early_stop:
+            page.wait_for_function(EARLY_STOP_READY_JS, arg=selectors,
+                                   polling='raf', timeout=self.timeout_ms)
+            page.evaluate("() => window.stop()")
+            return
+        for selector in selectors:
+            page.wait_for_selector(selector, timeout=self.timeout_ms)
+
+    async def wait_ready_async(self, page, selectors: Iterable[str]) -> None:
+        """
+        Versão assíncrona de wait_ready
+        """
+        selectors = list(selectors)
+        if not selectors:
+            return
+        if self.early_stop:
+            await page.wait_for_function(EARLY_STOP_READY_JS, arg=selectors,
+                                         polling='raf', timeout=self.timeout_ms)
+            await page.evaluate("() => window.stop()")
+            return
+        for selector in selectors:
+            await page.wait_for_selector(selector, timeout=self.timeout_ms)
+
+    def record(self, url: str, response_time: float, ready_time: Optional[float]) -> None:
+        """
+        Registra o tempo até a resposta do goto e até a página ficar pronta
+        (None se os seletores não apareceram)
+        """
+        with self._lock:
+            self.timings.append({'url': url, 'response': response_time, 'ready': ready_time})
+
+    def stats(self) -> Dict:
+        with self._lock:
+            timings = list(self.timings)
+        response_times = sorted(t['response'] for t in timings)
+        ready_times = sorted(t['ready'] for t in timings if t['ready'] is not None)
+        return {
+            'wait_until': self.wait_until,
+            'early_stop': self.early_stop,
+            'navigations': len(timings),
+            'not_ready': len(timings) - len(ready_times),
+            'response_p50': percentile(response_times, 50),
+            'response_p95': percentile(response_times, 95),
+            'ready_p50': percentile(ready_times, 50),
+            'ready_p95': percentile(ready_times, 95)
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        if not stats['navigations']:
+            return
+        mode = stats['wait_until'] + (' + parada antecipada' if stats['early_stop'] else '')
+        self.logger.info(
+            f"Navegação ({mode}): {stats['navigations']} páginas, {stats['not_ready']} sem seletores | "
+            f"resposta p50 {stats['response_p50']:.2f}s p95 {stats['response_p95']:.2f}s | "
+            f"pronta p50 {stats['ready_p50']:.2f}s p95 {stats['ready_p95']:.2f}s"
+        )
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Percentil `q` (0-100) de uma lista já ordenada; 0 se estiver vazia
+    """
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))
+    return values[index]
@@ -0,0 +1,148 @@
+from .asset_cache import AssetCache, get_asset_cache
+from urllib.parse import urlparse
+from typing import Dict, Iterable, Optional
+import logging
+
+# Tipos de recurso que não influenciam a extração dos dados
+DEFAULT_BLOCKED_RESOURCE_TYPES = ('image', 'font', 'media', 'stylesheet')
+
+# Domínios de anúncios e analytics carregados pelas páginas do InfoJobs
+DEFAULT_TRACKER_DOMAINS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'doubleclick.net',
+    'adservice.google.com',
+    'facebook.net',
+    'connect.facebook.com',
+    'hotjar.com',
+    'clarity.ms',
+    'criteo.com',
+    'criteo.net',
+    'taboola.com',
+    'outbrain.com',
+    'scorecardresearch.com',
+    'nr-data.net',
+    'bat.bing.com',
+    'analytics.tiktok.com',
+    'px.ads.linkedin.com'
+)
+
+class ResourcePolicy:
+    """
+    Decide quais requisições de um contexto do navegador devem ser abortadas
+    e mantém contadores do que foi bloqueado.
+
+    `allow` aceita tipos de recurso (ex.: 'stylesheet') ou domínios que
+    devem passar mesmo estando nas listas de bloqueio. Os arquivos estáticos
+    liberados passam pelo cache em disco compartilhado (`use_asset_cache`).
+    """
+
+    def __init__(self,
+                 blocked_resource_types: Optional[Iterable[str]] = None,
+                 tracker_domains: Optional[Iterable[str]] = None,
+                 allow: Optional[Iterable[str]] = None,
+                 enabled: bool = True,
+                 use_asset_cache: bool = True,
+                 asset_cache: Optional[AssetCache] = None):
+        self.blocked_resource_types = set(DEFAULT_BLOCKED_RESOURCE_TYPES if blocked_resource_types is None else blocked_resource_types)
+        self.tracker_domains = tuple(DEFAULT_TRACKER_DOMAINS if tracker_domains is None else tracker_domains)
+        self.allow = set(allow or ())
+        self.enabled = enabled
+        self.asset_cache = asset_cache or (get_asset_cache() if use_asset_cache else None)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.blocked_requests = 0
+        self.blocked_by_reason: Dict[str, int] = {}
+        self.allowed_requests = 0
+        self.allowed_bytes = 0
+
+    def block_reason(self, url: str, resource_type: str) -> Optional[str]:
+        """
+        Retorna o motivo do bloqueio ou None se a requisição deve seguir
+        """
+        if not self.enabled:
+            return None
+        host = urlparse(url).hostname or ''
+        if self._matches(host, self.allow) or resource_type in self.allow:
+            return None
+        if self._matches(host, self.tracker_domains):
+            return 'tracker'
+        if resource_type in self.blocked_resource_types:
+            return resource_type
+        return None
+
+    def _matches(self, host: str, domains: Iterable[str]) -> bool:
+        return any(host == domain or host.endswith('.' + domain) for domain in domains)
+
+    def _should_abort(self, request) -> bool:
+        reason = self.block_reason(request.url, request.resource_type)
+        if reason:
+            self.blocked_requests += 1
+            self.blocked_by_reason[reason] = self.blocked_by_reason.get(reason, 0) + 1
+            return True
+        self.allowed_requests += 1
+        return False
+
+    def _use_cache(self, request) -> bool:
+        return self.asset_cache is not None and self.asset_cache.applies_to(request)
+
+    def handle_route(self, route, request):
+        """
+        Handler para context.route (API sync do Playwright)
+        """
+        if self._should_abort(request):
+            route.abort('blockedbyclient')
+        elif self._use_cache(request):
+            self.asset_cache.handle(route, request)
+        else:
+            route.continue_()
+
+    async def handle_route_async(self, route, request):
+        """
+        Handler para context.route (API async do Playwright)
+        """
+        if self._should_abort(request):
+            await route.abort('blockedbyclient')
+        elif self._use_cache(request):
+            await self.asset_cache.handle_async(route, request)
+        else:
+            await route.continue_()
+
+    def _on_response(self, response):
+        """
+        Soma o tamanho declarado das respostas que passaram pela política
+        """
+        try:
+            self.allowed_bytes += int(response.headers.get('content-length', 0))
+        except (TypeError, ValueError):
+            pass
+
+    def attach(self, context):
+        """
+        Registra a política em um contexto. Na API async o retorno deve ser aguardado.
+        """
+        context.on('response', self._on_response)
+        if context.__class__.__module__.startswith('playwright.async_api'):
+            return context.route('**/*', self.handle_route_async)
+        return context.route('**/*', self.handle_route)
+
+    def stats(self) -> Dict:
+        """
+        Retorna os contadores de requisições bloqueadas e liberadas
+        """
+        return {
+            'blocked_requests': self.blocked_requests,
+            'blocked_by_reason': dict(self.blocked_by_reason),
+            'allowed_requests': self.allowed_requests,
+            'allowed_bytes': self.allowed_bytes
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        self.logger.info(
+            f"Requisições bloqueadas: {stats['blocked_requests']} {stats['blocked_by_reason']} | "
+            f"liberadas: {stats['allowed_requests']} ({stats['allowed_bytes'] / 1024:.0f} KB)"
+        )
+        if self.asset_cache is not None:
+            self.asset_cache.log_stats()
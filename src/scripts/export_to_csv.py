@@ -3,22 +3,14 @@ from src.data.supabase_client import SupabaseClient
 import csv
 from datetime import datetime
 
+EXPORT_COLUMNS = ['id', 'url', 'title', 'company', 'location', 'salary',
+                  'description', 'collected_at', 'category']
+
 def export_jobs_to_csv():
     # Inicializa o cliente do Supabase
     client = SupabaseClient()
     
     try:
-        # Query para buscar todos os jobs
-        client.cursor.execute("""
-            SELECT id, url, title, company, location, salary, 
-                   description, collected_at, category
-            FROM jobs
-            ORDER BY collected_at DESC
-        """)
-        
-        # Busca todos os resultados
-        rows = client.cursor.fetchall()
-        
         # Nome do arquivo com timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'jobs_export_{timestamp}.csv'
@@ -31,11 +23,13 @@ def export_jobs_to_csv():
             writer.writerow(['ID', 'URL', 'Título', 'Empresa', 'Localização', 
                            'Salário', 'Descrição', 'Data Coleta', 'Categoria'])
             
-            # Escreve os dados
-            for row in rows:
+            # Escreve os dados conforme chegam do banco, sem carregar a tabela inteira
+            total = 0
+            for job in client.iter_all_jobs(columns=EXPORT_COLUMNS):
+                job['category'] = ','.join(job['category'])
                 # Trata possíveis erros de encoding
                 processed_row = []
-                for item in row:
+                for item in (job[column] for column in EXPORT_COLUMNS):
                     if isinstance(item, str):
                         # Substitui caracteres que possam causar problemas no encoding latin1
                         processed_item = item.encode('latin1', errors='replace').decode('latin1')
@@ -43,16 +37,13 @@ def export_jobs_to_csv():
                         processed_item = item
                     processed_row.append(processed_item)
                 writer.writerow(processed_row)
+                total += 1
                 
         print(f'Arquivo CSV gerado com sucesso: {filename}')
-        print(f'Total de registros exportados: {len(rows)}')
+        print(f'Total de registros exportados: {total}')
         
     except Exception as e:
         print(f'Erro ao exportar dados: {str(e)}')
-    
-    finally:
-        client.cursor.close()
-        client.connection.close()
 
 if __name__ == '__main__':
     export_jobs_to_csv()
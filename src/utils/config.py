@@ -6,15 +6,36 @@ BASE_DIR = Path(__file__).resolve().parent.parent.parent
 DATA_DIR = os.path.join(BASE_DIR, "data")
 URLS_DIR = os.path.join(DATA_DIR, "urls")
 JOBS_DIR = os.path.join(DATA_DIR, "jobs")
+ASSET_CACHE_DIR = os.path.join(DATA_DIR, "asset_cache")
+BROWSER_PROFILES_DIR = os.path.join(DATA_DIR, "browser_profiles")
+BENCHMARKS_DIR = os.path.join(DATA_DIR, "benchmarks")
 
 # Arquivos
 URLS_FILE = os.path.join(URLS_DIR, "job_urls.csv")
 PROCESSED_URLS_FILE = os.path.join(URLS_DIR, "processed_urls.csv")
 
 # Configurações de scraping
-RATE_LIMIT_DELAY = 1  # segundos entre requisições
+SITE_URL = "https://www.infojobs.com.br"  # prefixo dos links relativos dos cards da listagem
+RATE_LIMIT_DELAY = 1  # segundos entre requisições (intervalo inicial por host)
+RATE_LIMIT_MAX_RATE = 8  # requisições por segundo por host, no máximo
+RATE_LIMIT_MIN_RATE = 0.1  # requisições por segundo por host, no mínimo
+RATE_LIMIT_BURST = 2  # requisições que podem sair de uma vez após um período ocioso
 MAX_RETRIES = 3
+ASSET_CACHE_MAX_BYTES = 200 * 1024 * 1024  # tamanho máximo do cache de arquivos estáticos
+ASSET_CACHE_SAVE_INTERVAL = 30  # segundos entre gravações do índice do cache de arquivos
+MAX_URL_ATTEMPTS = 5  # coletas iniciadas sem sucesso antes de uma URL deixar de ser processada
+MAX_BROWSER_RSS_MB = 1536  # memória somada dos navegadores antes de reciclar contextos/páginas
+MAX_DOM_NODES = 50000  # nós do DOM da listagem antes de remover os cards já lidos
+CLAIM_BATCH_SIZE = 50  # URLs reservadas por vez por cada worker
+LEASE_SECONDS = 900  # validade da reserva de um lote, renovada enquanto o worker está ativo
+
+# Configurações do banco de dados
+DB_INSERT_CHUNK_SIZE = 1000  # linhas por INSERT de várias linhas
+DB_POOL_MIN_CONNECTIONS = 1  # conexões mantidas abertas pelo pool do processo
+DB_POOL_MAX_CONNECTIONS = 10  # conexões simultâneas no máximo; acima disso os pedidos esperam
+DB_ITERSIZE = 2000  # linhas trazidas por vez pelos cursores server-side
+DB_HEALTH_CHECK_INTERVAL = 30  # segundos ociosa antes de uma conexão ser testada ao sair do pool
 
 # Criar diretórios se não existirem
-for directory in [DATA_DIR, URLS_DIR, JOBS_DIR]:
+for directory in [DATA_DIR, URLS_DIR, JOBS_DIR, BROWSER_PROFILES_DIR]:
     os.makedirs(directory, exist_ok=True)
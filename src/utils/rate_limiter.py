@@ -0,0 +1,131 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+from .config import RATE_LIMIT_DELAY, RATE_LIMIT_MAX_RATE, RATE_LIMIT_MIN_RATE, RATE_LIMIT_BURST
+
+class _Bucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.latency_avg = None
+
+class RateLimiter:
+    """
+    Token bucket por host com taxa adaptativa: a taxa cresce aos poucos
+    enquanto as respostas são boas e cai pela metade em respostas 429/503
+    ou quando a latência dispara em relação à média.
+    """
+
+    def __init__(self,
+                 rate: float = 1 / RATE_LIMIT_DELAY,
+                 max_rate: float = RATE_LIMIT_MAX_RATE,
+                 min_rate: float = RATE_LIMIT_MIN_RATE,
+                 burst: float = RATE_LIMIT_BURST,
+                 increase_step: float = 0.1,
+                 latency_spike_factor: float = 3.0):
+        self.initial_rate = rate
+        self.max_rate = max(max_rate, rate)
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        self.increase_step = increase_step
+        self.latency_spike_factor = latency_spike_factor
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _bucket(self, url: str) -> _Bucket:
+        host = urlparse(url).netloc or url
+        if host not in self._buckets:
+            self._buckets[host] = _Bucket(self.initial_rate, self.burst)
+        return self._buckets[host]
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserva uma vaga para uma requisição ao host da URL e retorna quantos
+        segundos é preciso esperar antes de enviá-la
+        """
+        with self._lock:
+            bucket = self._bucket(url)
+            now = time.monotonic()
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+            bucket.tokens -= 1
+            if bucket.tokens >= 0:
+                return 0.0
+            return -bucket.tokens / bucket.rate
+
+    def acquire(self, url: str) -> None:
+        """
+        Bloqueia até que uma requisição ao host possa ser enviada
+        """
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, url: str) -> None:
+        """
+        Versão assíncrona de acquire
+        """
+        wait = self.reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record(self, url: str, status: Optional[int] = None, latency: Optional[float] = None) -> None:
+        """
+        Ajusta a taxa do host com base no resultado de uma requisição.
+        status None indica que não houve resposta (timeout ou erro de conexão).
+        """
+        with self._lock:
+            bucket = self._bucket(url)
+            previous_rate = bucket.rate
+            if status is None or status == 429 or status >= 500:
+                # Sem resposta, 429 ou 5xx: o host está sobrecarregado
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+            elif latency is not None and bucket.latency_avg is not None \
+                    and latency > self.latency_spike_factor * bucket.latency_avg:
+                bucket.rate = max(self.min_rate, bucket.rate * 0.8)
+            elif status < 400:
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase_step)
+
+            # O tempo até um timeout não entra na média usada para detectar picos
+            if latency is not None and status is not None:
+                if bucket.latency_avg is None:
+                    bucket.latency_avg = latency
+                else:
+                    bucket.latency_avg = 0.8 * bucket.latency_avg + 0.2 * latency
+
+        if bucket.rate < previous_rate:
+            self.logger.warning(
+                f"Reduzindo taxa para {urlparse(url).netloc}: {previous_rate:.2f} -> {bucket.rate:.2f} req/s "
+                f"(status={status}, latência={latency if latency is None else round(latency, 2)})"
+            )
+
+    def current_rate(self, url: str) -> float:
+        with self._lock:
+            return self._bucket(url).rate
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Retorna o limitador compartilhado por todos os scrapers do processo
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+        return _rate_limiter
+
+def configure_rate_limiter(**kwargs) -> RateLimiter:
+    """
+    Substitui o limitador compartilhado por um com a configuração informada
+    """
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = RateLimiter(**kwargs)
+        return _rate_limiter
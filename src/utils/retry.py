@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+from .config import MAX_RETRIES
+
+class ScrapeError(Exception):
+    """
+    Falha ao coletar uma página. `status` guarda o código HTTP, quando houver.
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+# Códigos HTTP que indicam que a página não vai aparecer em uma nova tentativa
+PERMANENT_STATUS = (400, 401, 403, 404, 410)
+
+TRANSIENT_MESSAGES = ('timeout', 'net::err_', 'connection', 'target closed', 'browser has been closed', 'temporarily')
+
+def classify_error(error: Exception) -> str:
+    """
+    Classifica um erro como 'permanent' (não adianta tentar de novo) ou
+    'transient' (timeout, erro de rede, 429/5xx, navegador fechado...)
+    """
+    status = getattr(error, 'status', None)
+    if status in PERMANENT_STATUS:
+        return 'permanent'
+    if status is not None or isinstance(error, ScrapeError):
+        return 'transient'
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return 'transient'
+    message = str(error).lower()
+    if any(text in message for text in TRANSIENT_MESSAGES):
+        return 'transient'
+    if error.__class__.__name__ in ('TimeoutError', 'Timeout', 'ConnectionError', 'ReadTimeout', 'ConnectTimeout'):
+        return 'transient'
+    # Erros do Playwright (contexto destruído, seletor não encontrado...) vêm
+    # do navegador e não da página; respostas 4xx chegam como ScrapeError
+    if error.__class__.__module__.startswith('playwright.'):
+        return 'transient'
+    return 'permanent'
+
+class CircuitBreaker:
+    """
+    Acompanha a taxa de erro recente de um host. Quando ela passa do limite,
+    o circuito abre e todos os workers esperam `cooldown` segundos antes da
+    próxima requisição; depois disso as requisições voltam a sair e o
+    circuito fecha de novo se elas derem certo.
+    """
+
+    def __init__(self, name: str, threshold: float = 0.5, window: int = 20,
+                 min_requests: int = 10, cooldown: float = 30):
+        self.name = name
+        self.threshold = threshold
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self._results = deque(maxlen=window)
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def record(self, success: bool) -> None:
+        with self._lock:
+            self._results.append(success)
+            if len(self._results) < self.min_requests:
+                return
+            error_rate = self._results.count(False) / len(self._results)
+            if error_rate >= self.threshold and time.monotonic() >= self._open_until:
+                self._open_until = time.monotonic() + self.cooldown
+                self._results.clear()
+                self.logger.warning(
+                    f"Circuito aberto para {self.name}: taxa de erro {error_rate:.0%}. "
+                    f"Pausando requisições por {self.cooldown:.0f}s"
+                )
+
+    def remaining(self) -> float:
+        """
+        Segundos até o circuito permitir novas requisições (0 se fechado)
+        """
+        with self._lock:
+            return max(0.0, self._open_until - time.monotonic())
+
+    def wait(self) -> None:
+        remaining = self.remaining()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    async def wait_async(self) -> None:
+        remaining = self.remaining()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """
+    Retorna o circuit breaker compartilhado do host da URL
+    """
+    host = urlparse(url).netloc or url
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host)
+        return _breakers[host]
+
+class RetryPolicy:
+    """
+    Executa uma função de coleta com novas tentativas para erros
+    transitórios, usando backoff exponencial com jitter e respeitando o
+    circuit breaker do host.
+    """
+
+    def __init__(self, max_retries: int = MAX_RETRIES, base_delay: float = 1, max_delay: float = 30):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def delay(self, attempt: int) -> float:
+        """
+        Backoff exponencial com jitter completo para a tentativa `attempt` (1, 2, ...)
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def call(self, func: Callable, url: str):
+        """
+        Chama `func()` até dar certo ou esgotar as tentativas. Relança o último
+        erro; o atributo `attempts` do erro indica quantas tentativas foram feitas.
+        """
+        breaker = get_circuit_breaker(url)
+        attempt = 0
+        while True:
+            attempt += 1
+            breaker.wait()
+            try:
+                result = func()
+                breaker.record(True)
+                return result
+            except Exception as e:
+                # Erros permanentes (ex.: 404) não indicam problema no host
+                breaker.record(classify_error(e) == 'permanent')
+                if not self._should_retry(e, url, attempt):
+                    e.attempts = attempt
+                    raise
+                time.sleep(self.delay(attempt))
+
+    async def call_async(self, func: Callable, url: str):
+        """
+        Versão assíncrona de call, para funções que retornam corrotinas
+        """
+        breaker = get_circuit_breaker(url)
+        attempt = 0
+        while True:
+            attempt += 1
+            await breaker.wait_async()
+            try:
+                result = await func()
+                breaker.record(True)
+                return result
+            except Exception as e:
+                # Erros permanentes (ex.: 404) não indicam problema no host
+                breaker.record(classify_error(e) == 'permanent')
+                if not self._should_retry(e, url, attempt):
+                    e.attempts = attempt
+                    raise
+                await asyncio.sleep(self.delay(attempt))
+
+    def _should_retry(self, error: Exception, url: str, attempt: int) -> bool:
+        kind = classify_error(error)
+        if kind == 'permanent' or attempt > self.max_retries:
+            self.logger.error(f"Desistindo de {url} após {attempt} tentativa(s) ({kind}): {error}")
+            return False
+        self.logger.warning(f"Tentativa {attempt}/{self.max_retries + 1} falhou para {url}: {error}")
+        return True